@@ -4,26 +4,38 @@ Sequential OpenAI Batch pipeline with language filtering.
 
 Step 0 performs language filtering so that only English profiles (or profiles
 with very little text) proceed. Subsequent steps build batch input files and
-submit them to the OpenAI Batch API one-at-a-time, downloading the results for
-each chunk. Every source CSV keeps its own outputs under
+submit them to the OpenAI Batch API (uploads run concurrently), downloading the
+results for each chunk. Every source CSV keeps its own outputs under
 `<dataset>/pipeline_outputs/<csv-relative-path>/stepX_*`.
 """
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import json
 import os
+import queue
+import random
 import sys
+import threading
 import time
 import hashlib
-import statistics
+import heapq
+import itertools
+import mmap
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import string
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from itertools import islice
+from types import MappingProxyType
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 try:
     from dotenv import load_dotenv
@@ -74,7 +86,27 @@ except ImportError:
 
         Language = _FallbackLanguage
         LanguageDetectorBuilder = _FallbackBuilder
-from openai import OpenAI
+try:
+    import fasttext
+except ImportError:  # pragma: no cover
+    fasttext = None  # type: ignore[assignment]
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover
+    pa = None  # type: ignore[assignment]
+    pa_csv = None  # type: ignore[assignment]
+from openai import AsyncOpenAI, OpenAI
+
+# Placeholders a prompt template may reference
+PROMPT_CONTEXT_KEYS = frozenset({"account", "full_name", "biography", "captions", "post_locations"})
+
+# Distinct raw posts payloads memoized per process by Step 0 and Step 1
+POSTS_MEMO_SIZE = 1024
 
 # Text processing constants
 CAPTION_SNIPPET_CHARS = 50
@@ -85,10 +117,41 @@ DEFAULT_MIN_TEXT_CHARS = 60
 DEFAULT_LANGUAGE_BATCH_SIZE = 1500
 DEFAULT_CSV_WORKERS = max(1, min(8, os.cpu_count() or 4))
 LANGUAGE_FILTER_VERSION = "normalized-batching-v4"
+LANGUAGE_BACKENDS = ("lingua", "fasttext")
+DEFAULT_FASTTEXT_MODEL = "models/lid.176.ftz"
+# New language decisions buffered before the on-disk cache is rewritten
+LANGUAGE_CACHE_FLUSH_ROWS = 50_000
 
 # Combined dataset constants
 COMBINED_SUBDIR = "combined"
 COMBINED_FILENAME = "social_profiles.csv"
+# Posts columns routinely exceed the csv module's default 128 KiB field limit
+try:
+    csv.field_size_limit(sys.maxsize)
+except OverflowError:
+    csv.field_size_limit(2_147_483_647)
+# Larger file buffers for the multi-GB CSVs streamed by the combine step; the
+# writer gets a bigger one so several ~20 KiB posts rows coalesce per write(2)
+CSV_IO_BUFFER_BYTES = 1 << 20
+CSV_WRITE_BUFFER_BYTES = 4 << 20
+# Read size for source-file hashing when neither file_digest nor mmap is usable
+HASH_READ_BUFFER_BYTES = 4 << 20
+# Network read size (and raw file buffer) when streaming batch output files
+RESULTS_DOWNLOAD_CHUNK_BYTES = 4 << 20
+# Batch status polling starts at this delay and backs off up to --poll-interval
+MIN_POLL_SECONDS = 30
+POLL_BACKOFF_FACTOR = 1.5
+# Each wait is stretched by up to this fraction so concurrent runs drift apart
+POLL_JITTER_FRACTION = 0.1
+# Concurrent upload + create requests when submitting new batch jobs
+BATCH_SUBMIT_CONCURRENCY = 8
+# Block size for the Arrow CSV reader used by Step 0 (several rows per block)
+ARROW_CSV_BLOCK_BYTES = 16 << 20
+# Rows handed to the combine process pool per slice, and per worker task
+COMBINE_SUBMIT_BATCH = 4096
+COMBINE_CHUNKSIZE = 256
+# Parsed row slices buffered ahead of the pool by the combine reader thread
+COMBINE_PREFETCH_BATCHES = 4
 
 COMBINED_HEADERS = [
     "lance_db_id",
@@ -150,61 +213,173 @@ CSV_FIELD_ORDER = [
     "source_batch",
 ]
 
+_WS_RE = re.compile(r"\s+")
+# First plain string element of a JSON list, e.g. '["https://a.example", ...]'
+_FIRST_URL_RE = re.compile(r'\s*\[\s*"([^"\\]*)"\s*[,\]]')
+# Naive or UTC ("Z") ISO timestamps; explicit offsets go through fromisoformat
+_ISO_TIMESTAMP_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:\d{2})?$"
+)
+
+# Source keys probed (in priority order) for each normalized post field. The
+# first key holding a non-empty value wins, so the order is part of the schema.
+_POST_FIELD_KEYS: Dict[str, Tuple[str, ...]] = {
+    "id": ("id", "post_id", "aweme_id", "video_id"),
+    "caption": ("caption", "desc", "title", "text", "description"),
+    "like_count": ("likes", "like_count", "diggCount", "diggcount", "collectCount"),
+    "favorite_count": ("favorites_count", "favoriteCount", "collectCount"),
+    "comment_count": ("comments", "comment_count", "commentCount", "commentcount"),
+    "share_count": ("share_count", "shareCount", "forwardCount"),
+    "view_count": ("view_count", "viewCount", "playCount", "playcount"),
+    "url": ("url", "videoUrl", "video_url", "share_url", "permalink", "post_url"),
+    "media_type": ("content_type", "media_type", "type", "post_type"),
+    "timestamp": ("datetime", "createTime", "create_time", "create_date", "published_at"),
+    "duration": ("duration", "videoDuration", "video_duration"),
+    "hashtags": ("hashtags", "post_hashtags"),
+    "thumbnail_url": ("image_url", "thumbnail_url", "thumb_url", "cover_image"),
+}
+# Source keys consumed by the mapping above; anything else is kept under "extra"
+_KNOWN_POST_KEYS = frozenset(key for keys in _POST_FIELD_KEYS.values() for key in keys)
+
+
+def _json_loads(value: str) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # orjson is strict about NaN/Infinity; let the stdlib parser decide.
+            pass
+    return json.loads(value)
+
+
+def _json_dumps_bytes(value: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # e.g. integers beyond 64 bits or non-string keys
+            pass
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def _json_dumps(value: Any) -> str:
+    return _json_dumps_bytes(value).decode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _hashtag_re(tags: Tuple[str, ...]) -> "re.Pattern[str]":
+    alternation = "|".join(re.escape(tag) for tag in tags)
+    return re.compile(rf"(?i)(?<!\w)#\s*(?:{alternation})\b")
+
+
+_BOOL_STRINGS = {
+    "true": "true",
+    "1": "true",
+    "yes": "true",
+    "false": "false",
+    "0": "false",
+    "no": "false",
+    # common spellings resolved without strip()/lower()
+    "True": "true",
+    "TRUE": "true",
+    "False": "false",
+    "FALSE": "false",
+    "": "",
+}
+
 
 def _parse_bool(value: Any) -> str:
+    if isinstance(value, str):
+        parsed = _BOOL_STRINGS.get(value)
+        if parsed is None:
+            parsed = _BOOL_STRINGS.get(value.strip().lower(), "")
+        return parsed
     if isinstance(value, bool):
         return "true" if value else "false"
-    if isinstance(value, str):
-        stripped = value.strip().lower()
-        if stripped in {"true", "1", "yes"}:
-            return "true"
-        if stripped in {"false", "0", "no"}:
-            return "false"
-        return ""
     return ""
 
 
 def _safe_json_loads(value: Any) -> Any:
     if isinstance(value, str):
         try:
-            return json.loads(value)
+            return _json_loads(value)
         except Exception:
             return []
     return []
 
 
+# Profile columns that may carry literal escape sequences from the scrapers
+_ESCAPED_TEXT_FIELDS = (
+    "profile_name",
+    "full_name",
+    "account",
+    "business_category_name",
+    "category_name",
+    "external_url",
+    "bio_hashtags",
+    "business_email",
+    "email_address",
+    "location",
+)
+# Every column Step 0 normalization and the language sample read; the rest
+# of a profile row passes through to the output CSVs untouched
+NORMALIZE_INPUT_COLUMNS = (
+    "biography",
+    "posts",
+    "platform",
+    "platform_type",
+    "source_platform",
+    "platform_name",
+    *_ESCAPED_TEXT_FIELDS,
+)
+
+
 def _decode_text(value: str) -> str:
     if not value:
         return value
+    # Literal escape sequences from the scrapers are kept verbatim
+    return value.strip()
+
+
+def _language_cache_key(sample_text: str) -> str:
+    return hashlib.blake2b(
+        sample_text.encode("utf-8", "surrogatepass"), digest_size=8
+    ).hexdigest()
+
+
+def _first_present(item: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        value = item.get(key)
+        if value is not None and value != "" and value != []:
+            return value
+    return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if type(value) is int:
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return None
+        digits = text[1:] if text[0] == "-" else text
+        if digits.isascii() and digits.isdigit():
+            return int(text)
+    elif value is None or value == []:
+        return None
     try:
-        escaped = value.replace("\\", "\\\\").replace("\"", "\\\"")
-        decoded = json.loads(f'"{escaped}"')
+        return int(float(value))
     except Exception:
-        return value.strip()
-    return decoded.strip()
+        return None
 
 
-def _normalize_posts(entries: Any, platform: str) -> str:
+def _normalize_post_entries(entries: Any, platform: str) -> List[Dict[str, Any]]:
     posts: List[Dict[str, Any]] = []
     if isinstance(entries, str):
         entries = _safe_json_loads(entries)
     if not isinstance(entries, list):
         entries = []
 
-    def _first(item: Dict[str, Any], *keys: str) -> Any:
-        for key in keys:
-            if key in item and item[key] not in (None, "", []):
-                return item[key]
-        return None
-
-    def _to_int(value: Any) -> Optional[int]:
-        if value in (None, "", []):
-            return None
-        try:
-            return int(float(value))
-        except Exception:
-            return None
-
     def _to_list(value: Any) -> Optional[List[Any]]:
         if value in (None, ""):
             return None
@@ -213,7 +388,7 @@ def _normalize_posts(entries: Any, platform: str) -> str:
         if isinstance(value, str):
             # comma separated or JSON string fallbacks
             try:
-                parsed = json.loads(value)
+                parsed = _json_loads(value)
                 if isinstance(parsed, list):
                     return parsed
             except Exception:
@@ -221,55 +396,28 @@ def _normalize_posts(entries: Any, platform: str) -> str:
                 return parts or None
         return None
 
+    default_media_type = "video" if platform == "tiktok" else "image"
+    first = _first_present
+    keys = _POST_FIELD_KEYS
+
     for item in entries:
         if not isinstance(item, dict):
             continue
 
-        post_id = _first(item, "id", "post_id", "aweme_id", "video_id")
-        caption = _first(item, "caption", "desc", "title", "text", "description") or ""
+        post_id = first(item, keys["id"])
+        caption = first(item, keys["caption"]) or ""
         if isinstance(caption, str):
             caption = _decode_text(caption)
-        like_count = _to_int(
-            _first(item, "likes", "like_count", "diggCount", "diggcount", "collectCount")
-        )
-        favorite_count = _to_int(
-            _first(item, "favorites_count", "favoriteCount", "collectCount")
-        )
-        comment_count = _to_int(
-            _first(item, "comments", "comment_count", "commentCount", "commentcount")
-        )
-        share_count = _to_int(
-            _first(item, "share_count", "shareCount", "forwardCount")
-        )
-        view_count = _to_int(
-            _first(item, "view_count", "viewCount", "playCount", "playcount")
-        )
-        url = _first(
-            item,
-            "url",
-            "videoUrl",
-            "video_url",
-            "share_url",
-            "permalink",
-            "post_url",
-        )
-        media_type = _first(
-            item,
-            "content_type",
-            "media_type",
-            "type",
-            "post_type",
-        ) or ("video" if platform == "tiktok" else "image")
-        timestamp = _first(
-            item,
-            "datetime",
-            "createTime",
-            "create_time",
-            "create_date",
-            "published_at",
-        )
-        duration = _first(item, "duration", "videoDuration", "video_duration")
-        hashtags_raw = _to_list(_first(item, "hashtags", "post_hashtags"))
+        like_count = _to_int(first(item, keys["like_count"]))
+        favorite_count = _to_int(first(item, keys["favorite_count"]))
+        comment_count = _to_int(first(item, keys["comment_count"]))
+        share_count = _to_int(first(item, keys["share_count"]))
+        view_count = _to_int(first(item, keys["view_count"]))
+        url = first(item, keys["url"])
+        media_type = first(item, keys["media_type"]) or default_media_type
+        timestamp = first(item, keys["timestamp"])
+        duration = first(item, keys["duration"])
+        hashtags_raw = _to_list(first(item, keys["hashtags"]))
         hashtags: List[str] = []
         if hashtags_raw:
             for tag in hashtags_raw:
@@ -279,13 +427,7 @@ def _normalize_posts(entries: Any, platform: str) -> str:
                         clean_tag = clean_tag[1:]
                     if clean_tag:
                         hashtags.append(clean_tag)
-        thumbnail_url = _first(
-            item,
-            "image_url",
-            "thumbnail_url",
-            "thumb_url",
-            "cover_image",
-        )
+        thumbnail_url = first(item, keys["thumbnail_url"])
 
         location_name = ""
         if platform == "instagram":
@@ -316,14 +458,10 @@ def _normalize_posts(entries: Any, platform: str) -> str:
                     location_name = _decode_text(location_name)
 
         if caption and hashtags:
-            cleaned_caption = caption
-            for tag in hashtags:
-                pattern = re.compile(rf"(?i)(?<!\\w)#\s*{re.escape(tag)}\b")
-                cleaned_caption = pattern.sub("", cleaned_caption)
-            cleaned_caption = re.sub(r"\s+", " ", cleaned_caption).strip()
-            caption = cleaned_caption
+            pattern = _hashtag_re(tuple(sorted(set(hashtags))))
+            caption = _WS_RE.sub(" ", pattern.sub("", caption)).strip()
         elif caption:
-            caption = re.sub(r"\s+", " ", caption).strip()
+            caption = _WS_RE.sub(" ", caption).strip()
 
         mapped = {
             "platform": platform,
@@ -343,69 +481,20 @@ def _normalize_posts(entries: Any, platform: str) -> str:
             "location_name": location_name,
         }
 
-        extra = {
-            key: value
-            for key, value in item.items()
-            if key not in {
-                "id",
-                "post_id",
-                "aweme_id",
-                "video_id",
-                "caption",
-                "desc",
-                "title",
-                "text",
-                "description",
-                "likes",
-                "like_count",
-                "diggCount",
-                "diggcount",
-                "collectCount",
-                "favorites_count",
-                "favoriteCount",
-                "comments",
-                "comment_count",
-                "commentCount",
-                "commentcount",
-                "share_count",
-                "shareCount",
-                "forwardCount",
-                "view_count",
-                "viewCount",
-                "playCount",
-                "playcount",
-                "url",
-                "videoUrl",
-                "video_url",
-                "share_url",
-                "permalink",
-                "post_url",
-                "content_type",
-                "media_type",
-                "type",
-                "post_type",
-                "datetime",
-                "createTime",
-                "create_time",
-                "create_date",
-                "published_at",
-                "duration",
-                "videoDuration",
-                "video_duration",
-                "hashtags",
-                "post_hashtags",
-                "image_url",
-                "thumbnail_url",
-                "thumb_url",
-                "cover_image",
-            }
-        }
+        if item.keys() <= _KNOWN_POST_KEYS:
+            extra = None
+        else:
+            extra = {key: value for key, value in item.items() if key not in _KNOWN_POST_KEYS}
         if extra:
             mapped["extra"] = extra
 
         posts.append(mapped)
 
-    return json.dumps(posts, ensure_ascii=False)
+    return posts
+
+
+def _normalize_posts(entries: Any, platform: str) -> str:
+    return _json_dumps(_normalize_post_entries(entries, platform))
 
 
 def _merge_tiktok_posts(raw: Dict[str, str]) -> List[Dict[str, Any]]:
@@ -450,69 +539,148 @@ def _merge_tiktok_posts(raw: Dict[str, str]) -> List[Dict[str, Any]]:
     return [combined[key] for key in order]
 
 
-def _compute_post_statistics(posts_json: str) -> Tuple[str, str, str, str]:
-    if not posts_json:
-        return "", "", ""
+def _parse_post_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    raw = value.strip()
+    if not raw:
+        return None
+    match = _ISO_TIMESTAMP_RE.match(raw)
+    if match:
+        year, month, day, hour, minute, second, fraction, zone = match.groups()
+        if zone is None or zone == "Z":
+            try:
+                return datetime(
+                    int(year),
+                    int(month),
+                    int(day),
+                    int(hour),
+                    int(minute),
+                    int(second),
+                    int(fraction.ljust(6, "0")) if fraction else 0,
+                    tzinfo=timezone.utc if zone else None,
+                )
+            except ValueError:
+                return None
     try:
-        posts = json.loads(posts_json)
-    except Exception:
-        return "", "", ""
-    if not isinstance(posts, list):
-        return "", "", ""
-
-    def _parse_timestamp(value: Any) -> Optional[datetime]:
-        if not isinstance(value, str) or not value.strip():
-            return None
-        raw = value.strip()
-        try:
-            if raw.endswith("Z"):
-                return datetime.fromisoformat(raw[:-1] + "+00:00")
-            return datetime.fromisoformat(raw)
-        except Exception:
-            # best-effort fallback for common ISO formats without timezone
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
-                try:
-                    return datetime.strptime(raw, fmt)
-                except Exception:
-                    continue
+        if raw.endswith("Z"):
+            return datetime.fromisoformat(raw[:-1] + "+00:00")
+        return datetime.fromisoformat(raw)
+    except ValueError:
         return None
 
-    enumerated: List[Tuple[int, Dict[str, Any], Optional[datetime]]] = []
-    for idx, post in enumerate(posts):
-        if isinstance(post, dict):
-            enumerated.append((idx, post, _parse_timestamp(post.get("timestamp"))))
 
-    with_timestamp = [item for item in enumerated if item[2] is not None]
-    without_timestamp = [item for item in enumerated if item[2] is None]
-    with_timestamp.sort(key=lambda item: item[2], reverse=True)
-    without_timestamp.sort(key=lambda item: item[0])
+_IG_IMAGE_TYPES = frozenset({"graphimage", "image", "photo", "graphsidecar"})
+_IG_REEL_TYPES = frozenset({"reel", "video", "graphvideo", "igtv"})
+_REEL_LIKE_TYPES = frozenset({"igtv", "graphvideo"})
 
-    ordered_posts = [item[1] for item in with_timestamp + without_timestamp][:10]
+# Number of most recent posts summarized by the *_last10 columns
+RECENT_POSTS_WINDOW = 10
 
-    total = 0
-    reel_like = 0
-    view_values: List[int] = []
-    like_values: List[int] = []
-    comment_values: List[int] = []
+MEDIA_IMAGE = 0
+MEDIA_REEL = 1
+MEDIA_OTHER = 2
 
-    def _is_reel(media_type: Optional[str]) -> bool:
-        if not media_type:
-            return False
-        lowered = media_type.lower()
-        if "reel" in lowered:
-            return True
-        if "video" in lowered:
-            return True
-        if lowered in {"igtv", "graphvideo"}:
-            return True
-        return False
 
-    for post in ordered_posts:
+@lru_cache(maxsize=1024)
+def _classify_media_type(media_type: str) -> Tuple[bool, int]:
+    """Return ``(counts_as_reel, instagram_media_kind)`` for a raw media type.
+
+    Media types are a small vocabulary, so the cache acts as a lookup table and
+    each distinct spelling is lowered and probed only once.
+    """
+    lowered = media_type.lower()
+    reel_like = bool(lowered) and (
+        "reel" in lowered or "video" in lowered or lowered in _REEL_LIKE_TYPES
+    )
+    if lowered in _IG_REEL_TYPES:
+        kind = MEDIA_REEL
+    elif lowered in _IG_IMAGE_TYPES:
+        kind = MEDIA_IMAGE
+    elif "video" in lowered or "reel" in lowered:
+        kind = MEDIA_REEL
+    elif "image" in lowered or "photo" in lowered:
+        kind = MEDIA_IMAGE
+    else:
+        kind = MEDIA_OTHER
+    return reel_like, kind
+
+
+def _format_ratio(num: int, denom: int) -> str:
+    if denom <= 0:
+        return ""
+    ratio = num / denom
+    return f"{ratio:.3f}"
+
+
+def _format_median(values: List[int]) -> str:
+    # Sorts ``values`` in place; callers pass throwaway lists of ints.
+    count = len(values)
+    if not count:
+        return ""
+    values.sort()
+    mid = count // 2
+    if count & 1:
+        return str(values[mid])
+    pair_sum = values[mid - 1] + values[mid]
+    if pair_sum & 1:
+        return f"{pair_sum / 2:.3f}"
+    return str(pair_sum // 2)
+
+
+def _summarize_posts(posts: Any, count_media: bool) -> Tuple[str, str, str, str, str, str]:
+    """Compute the last-10 statistics and Instagram media counts in one pass.
+
+    Returns ``(reel_ratio, median_view, median_like, median_comment,
+    total_images, total_reels)``; the media counts stay empty unless
+    ``count_media`` is set.
+    """
+    if not isinstance(posts, list):
+        return "", "", "", "", "", ""
+
+    total_images = 0
+    total_reels = 0
+    candidates: List[Tuple[Dict[str, Any], bool]] = []
+    for post in posts:
         if not isinstance(post, dict):
             continue
-        total += 1
         media_type = post.get("media_type")
-        if _is_reel(media_type if isinstance(media_type, str) else None):
+        if isinstance(media_type, str):
+            is_reel, kind = _classify_media_type(media_type)
+            if count_media:
+                if kind == MEDIA_REEL:
+                    total_reels += 1
+                elif kind == MEDIA_IMAGE:
+                    total_images += 1
+        else:
+            is_reel = False
+        candidates.append((post, is_reel))
+
+    # The statistics are order-independent, so the newest-first ordering only
+    # matters when there are more posts than the window holds.
+    if len(candidates) <= RECENT_POSTS_WINDOW:
+        recent_posts = candidates
+    else:
+        with_timestamp: List[Tuple[datetime, Tuple[Dict[str, Any], bool]]] = []
+        without_timestamp: List[Tuple[Dict[str, Any], bool]] = []
+        for candidate in candidates:
+            timestamp = _parse_post_timestamp(candidate[0].get("timestamp"))
+            if timestamp is None:
+                without_timestamp.append(candidate)
+            else:
+                with_timestamp.append((timestamp, candidate))
+        newest = heapq.nlargest(RECENT_POSTS_WINDOW, with_timestamp, key=lambda item: item[0])
+        recent_posts = [item[1] for item in newest]
+        recent_posts.extend(without_timestamp[: RECENT_POSTS_WINDOW - len(recent_posts)])
+
+    total = len(recent_posts)
+    reel_like = 0
+    view_values: List[int] = []
+    like_values: List[int] = []
+    comment_values: List[int] = []
+
+    for post, is_reel in recent_posts:
+        if is_reel:
             reel_like += 1
 
         like = post.get("like_count")
@@ -525,67 +693,273 @@ def _compute_post_statistics(posts_json: str) -> Tuple[str, str, str, str]:
         if isinstance(comments, (int, float)):
             comment_values.append(int(comments))
 
-    def _format_ratio(num: int, denom: int) -> str:
-        if denom <= 0:
-            return ""
-        ratio = num / denom
-        return f"{ratio:.3f}"
-
-    def _format_median(values: List[int]) -> str:
-        if not values:
-            return ""
-        med = statistics.median(values)
-        if isinstance(med, float) and med.is_integer():
-            return str(int(med))
-        return f"{med:.3f}" if isinstance(med, float) else str(med)
-
-    ratio = _format_ratio(reel_like, total)
-    median_view = _format_median(view_values)
-    median_like = _format_median(like_values)
-    median_comment = _format_median(comment_values)
+    media_counts = (
+        (str(total_images) if total_images else "", str(total_reels) if total_reels else "")
+        if count_media
+        else ("", "")
+    )
+    return (
+        _format_ratio(reel_like, total),
+        _format_median(view_values),
+        _format_median(like_values),
+        _format_median(comment_values),
+        *media_counts,
+    )
+
+
+def _normalize_and_stat(entries: Any, platform: str) -> Tuple[str, str, str, str, str, str, str]:
+    """Normalize posts and summarize them without a JSON round trip.
+
+    Returns ``(posts_json, reel_ratio, median_view, median_like,
+    median_comment, total_images, total_reels)``.
+    """
+    posts = _normalize_post_entries(entries, platform)
+    summary = _summarize_posts(posts, platform == "instagram")
+    return (_json_dumps(posts), *summary)
+
 
+def _load_posts(posts: Any) -> Any:
+    if isinstance(posts, str):
+        if not posts:
+            return None
+        try:
+            return _json_loads(posts)
+        except Exception:
+            return None
+    return posts
+
+
+def _compute_post_statistics(posts_json: Any) -> Tuple[str, str, str, str]:
+    ratio, median_view, median_like, median_comment, _, _ = _summarize_posts(
+        _load_posts(posts_json), False
+    )
     return ratio, median_view, median_like, median_comment
 
 
-def _count_instagram_media(posts_json: str) -> Tuple[str, str]:
-    if not posts_json:
-        return "", ""
-    try:
-        posts = json.loads(posts_json)
-    except Exception:
-        return "", ""
-    if not isinstance(posts, list):
-        return "", ""
+def _count_instagram_media(posts_json: Any) -> Tuple[str, str]:
+    return _summarize_posts(_load_posts(posts_json), True)[4:]
 
-    image_types = {"graphimage", "image", "photo", "graphsidecar"}
-    reel_types = {"reel", "video", "graphvideo", "igtv"}
 
-    total_images = 0
-    total_reels = 0
-    for post in posts:
-        if not isinstance(post, dict):
-            continue
-        media_type = post.get("media_type")
-        if isinstance(media_type, str):
-            lowered = media_type.lower()
-            if lowered in image_types:
-                total_images += 1
-            elif lowered in reel_types:
-                total_reels += 1
-            elif "video" in lowered or "reel" in lowered:
-                total_reels += 1
-            elif "image" in lowered or "photo" in lowered:
-                total_images += 1
+def _first_external_url(external_raw: Any) -> Any:
+    if not isinstance(external_raw, str):
+        return external_raw
+    match = _FIRST_URL_RE.match(external_raw)
+    if match:
+        return match.group(1)
+    if external_raw.lstrip().startswith("["):
+        # Escaped, non-string or empty first elements take the full JSON path.
+        try:
+            return _json_loads(external_raw)[0]
+        except Exception:
+            return external_raw
+    return external_raw
+
+
+def _process_instagram_row(raw: Dict[str, str]) -> Tuple[str, ...]:
+    """Return the combined fields after ``lance_db_id`` for an Instagram row."""
+    (
+        posts_json,
+        reel_ratio,
+        median_view,
+        median_like,
+        median_comment,
+        total_images,
+        total_reels,
+    ) = _normalize_and_stat(_safe_json_loads(raw.get("posts")), "instagram")
+
+    first_url = _first_external_url(raw.get("external_url", ""))
+
+    return (
+        "instagram",
+        raw.get("fbid", ""),
+        raw.get("account", ""),
+        raw.get("profile_name") or raw.get("full_name", ""),
+        raw.get("biography", ""),
+        raw.get("followers", ""),
+        raw.get("following", ""),
+        raw.get("posts_count", ""),
+        "",
+        raw.get("avg_engagement", ""),
+        first_url,
+        raw.get("profile_url", ""),
+        raw.get("profile_image_link", ""),
+        _parse_bool(raw.get("is_verified")),
+        _parse_bool(raw.get("is_private")),
+        "false",
+        posts_json,
+        reel_ratio,
+        median_view,
+        median_like,
+        median_comment,
+        total_images,
+        total_reels,
+    )
 
-    return (str(total_images) if total_images else "", str(total_reels) if total_reels else "")
 
+def _process_tiktok_row(raw: Dict[str, str]) -> Tuple[str, ...]:
+    """Return the combined fields after ``lance_db_id`` for a TikTok row."""
+    merged_posts = _merge_tiktok_posts(raw)
+    posts_json, reel_ratio, median_view, median_like, median_comment, _, _ = (
+        _normalize_and_stat(merged_posts, "tiktok")
+    )
+    return (
+        "tiktok",
+        raw.get("id", ""),
+        raw.get("account_id", ""),
+        raw.get("profile_name") or raw.get("nickname", ""),
+        raw.get("biography") or raw.get("signature", ""),
+        raw.get("followers", ""),
+        raw.get("following", ""),
+        raw.get("videos_count", ""),
+        raw.get("likes", ""),
+        raw.get("awg_engagement_rate", ""),
+        raw.get("bio_link", ""),
+        raw.get("url", ""),
+        raw.get("profile_pic_url_hd", raw.get("profile_pic_url", "")),
+        _parse_bool(raw.get("is_verified")),
+        _parse_bool(raw.get("is_private")),
+        _parse_bool(raw.get("is_commerce_user")),
+        posts_json,
+        reel_ratio,
+        median_view,
+        median_like,
+        median_comment,
+        "",
+        "",
+    )
 
-def combine_platform_datasets(root_dir: Path) -> Path:
-    print(f"\n🔗 Combining platform datasets under {root_dir}")
+
+def _open_csv_records(path: Path) -> Tuple[Optional[List[str]], Iterator[Dict[str, str]]]:
+    """Return the header of ``path`` and an iterator over its rows as dicts.
+
+    PyArrow parses the file in C++ blocks when installed; every column is read
+    as a string so values round-trip exactly like ``csv.DictReader``. A UTF-8
+    BOM is dropped from the first column name on both paths.
+    """
+    with path.open("r", encoding="utf-8-sig", newline="") as fh:
+        header = next(csv.reader(fh), None)
+    if header is None:
+        return None, iter(())
+
+    def _dict_rows(skip: int = 0) -> Iterator[Dict[str, str]]:
+        with path.open("r", encoding="utf-8-sig", newline="", buffering=CSV_IO_BUFFER_BYTES) as fh:
+            yield from itertools.islice(csv.DictReader(fh), skip, None)
+
+    if pa_csv is None:
+        return header, _dict_rows()
+
+    def _arrow_rows() -> Iterator[Dict[str, str]]:
+        yielded = 0
+        try:
+            reader = pa_csv.open_csv(
+                str(path),
+                read_options=pa_csv.ReadOptions(block_size=ARROW_CSV_BLOCK_BYTES),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+            for batch in reader:
+                rows = batch.to_pylist()
+                yielded += len(rows)
+                yield from rows
+        except pa.ArrowInvalid:
+            # Rows whose field count differs from the header; DictReader keeps
+            # them (missing fields as None), so resume there after the rows
+            # already produced.
+            print(f"   ⚠️  Ragged rows in {path.name}; reading the rest with csv.DictReader")
+            yield from _dict_rows(skip=yielded)
+
+    return header, _arrow_rows()
+
+
+def _canonical_int(value: str) -> Optional[int]:
+    """Return ``int(value)`` only when ``str()`` of it gives ``value`` back."""
+    digits = value[1:] if value[:1] == "-" else value
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    if digits[0] == "0" and value != "0":
+        return None
+    return int(value)
+
+
+def _prefetch_batches(rows: Iterable[Dict[str, str]], batch_size: int) -> Iterator[List[Dict[str, str]]]:
+    """Read ``rows`` on a background thread into a bounded queue of batches."""
+    batches: "queue.Queue[Any]" = queue.Queue(maxsize=COMBINE_PREFETCH_BATCHES)
+    done = object()
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _reader() -> None:
+        try:
+            iterator = iter(rows)
+            while True:
+                batch = list(islice(iterator, batch_size))
+                if not batch or not _put(batch):
+                    break
+        except BaseException as exc:  # surfaced on the consumer side
+            _put(exc)
+        finally:
+            _put(done)
+
+    thread = threading.Thread(target=_reader, name="csv-prefetch", daemon=True)
+    thread.start()
     try:
-        csv.field_size_limit(sys.maxsize)
-    except OverflowError:
-        csv.field_size_limit(2_147_483_647)
+        while True:
+            item = batches.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _iter_processed_rows(
+    rows: Iterable[Dict[str, str]],
+    worker: Callable[[Dict[str, str]], Any],
+    executor: Optional[ProcessPoolExecutor],
+    project: Optional[Callable[[Dict[str, str]], Dict[str, str]]] = None,
+) -> Iterator[Tuple[Dict[str, str], Any]]:
+    """Yield ``(raw, fields)`` pairs in input order.
+
+    CSV parsing runs on a reader thread, and the next slice is already
+    submitted to the process pool while the caller writes the current one.
+    Slices are bounded, so large CSVs are never fully materialised as
+    pending futures. ``project`` trims each row to what ``worker`` reads
+    before it is pickled; ``raw`` is still the full row.
+    """
+    if executor is None:
+        for raw in rows:
+            yield raw, worker(project(raw) if project else raw)
+        return
+
+    in_flight: Deque[Tuple[List[Dict[str, str]], Iterator[Any]]] = deque()
+    for batch in _prefetch_batches(rows, COMBINE_SUBMIT_BATCH):
+        inputs = map(project, batch) if project else batch
+        in_flight.append((batch, executor.map(worker, inputs, chunksize=COMBINE_CHUNKSIZE)))
+        if len(in_flight) > 1:
+            ready, results = in_flight.popleft()
+            yield from zip(ready, results)
+    while in_flight:
+        ready, results = in_flight.popleft()
+        yield from zip(ready, results)
+
+
+def combine_platform_datasets(root_dir: Path, workers: int = DEFAULT_CSV_WORKERS) -> Path:
+    print(f"\n🔗 Combining platform datasets under {root_dir}")
     instagram_dir = root_dir / "instagram"
     tiktok_dir = root_dir / "tiktok"
     tiktok_file = tiktok_dir / "tiktok.csv"
@@ -599,121 +973,77 @@ def combine_platform_datasets(root_dir: Path) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / COMBINED_FILENAME
 
-    used_ids: set[str] = set()
+    # Canonical integer ids ("42") are tracked as ints; anything else ("05",
+    # "abc") keeps its literal string so distinct source ids stay distinct.
+    used_numeric_ids: set[int] = set()
+    used_other_ids: set[str] = set()
+    next_free_id = 1
     max_numeric_id = 0
+
+    def _next_free_id(start: int) -> int:
+        # Every id between an earlier start and next_free_id is already taken
+        # and the used set only grows, so the scan resumes where it left off.
+        nonlocal next_free_id
+        next_free_id = max(next_free_id, start)
+        while next_free_id in used_numeric_ids:
+            next_free_id += 1
+        return next_free_id
+
     instagram_count = 0
     tiktok_count = 0
 
-    print(f"   📝 Streaming combined dataset to {output_file}")
-    with output_file.open("w", encoding="utf-8", newline="") as out_fh:
-        writer = csv.DictWriter(out_fh, fieldnames=COMBINED_HEADERS)
-        writer.writeheader()
+    print(f"   📝 Streaming combined dataset to {output_file} ({workers} worker(s))")
+    with ExitStack() as stack:
+        executor = (
+            stack.enter_context(ProcessPoolExecutor(max_workers=workers)) if workers > 1 else None
+        )
+        out_fh = stack.enter_context(
+            output_file.open("w", encoding="utf-8", newline="", buffering=CSV_WRITE_BUFFER_BYTES)
+        )
+        writer = csv.writer(out_fh)
+        writer.writerow(COMBINED_HEADERS)
 
         for csv_file in sorted(instagram_dir.glob("*.csv")):
             print(f"   📥 Processing Instagram file: {csv_file.name}")
-            with csv_file.open("r", encoding="utf-8") as fh:
+            with csv_file.open("r", encoding="utf-8", buffering=CSV_IO_BUFFER_BYTES) as fh:
                 reader = csv.DictReader(fh)
-                for raw in tqdm(reader, desc=f"Instagram {csv_file.name}", unit="rows"):
-                    posts_json = _normalize_posts(_safe_json_loads(raw.get("posts")), "instagram")
-                    reel_ratio, median_view, median_like, median_comment = _compute_post_statistics(posts_json)
-                    total_images, total_reels = _count_instagram_media(posts_json)
-
-                    external_raw = raw.get("external_url", "")
-                    if isinstance(external_raw, str) and external_raw.strip().startswith("["):
-                        try:
-                            first_url = json.loads(external_raw)[0]
-                        except Exception:
-                            first_url = external_raw
-                    else:
-                        first_url = external_raw
-
+                rows = tqdm(reader, desc=f"Instagram {csv_file.name}", unit="rows")
+                for raw, fields in _iter_processed_rows(rows, _process_instagram_row, executor):
                     lance_id = (raw.get("lance_db_id") or "").strip()
-                    if not lance_id:
-                        lance_id = str(instagram_count + 1)
-                    if lance_id in used_ids:
-                        candidate = instagram_count + 1
-                        while str(candidate) in used_ids:
-                            candidate += 1
-                        lance_id = str(candidate)
-                    used_ids.add(lance_id)
-                    try:
-                        max_numeric_id = max(max_numeric_id, int(lance_id))
-                    except Exception:
-                        pass
-
-                    writer.writerow(
-                        {
-                            "lance_db_id": lance_id,
-                            "platform": "instagram",
-                            "platform_id": raw.get("fbid", ""),
-                            "username": raw.get("account", ""),
-                            "display_name": raw.get("profile_name") or raw.get("full_name", ""),
-                            "biography": raw.get("biography", ""),
-                            "followers": raw.get("followers", ""),
-                            "following": raw.get("following", ""),
-                            "posts_count": raw.get("posts_count", ""),
-                            "likes_total": "",
-                            "engagement_rate": raw.get("avg_engagement", ""),
-                            "external_url": first_url,
-                            "profile_url": raw.get("profile_url", ""),
-                            "profile_image_url": raw.get("profile_image_link", ""),
-                            "is_verified": _parse_bool(raw.get("is_verified")),
-                            "is_private": _parse_bool(raw.get("is_private")),
-                            "is_commerce_user": "false",
-                            "posts": posts_json,
-                            "reel_post_ratio_last10": reel_ratio,
-                            "median_view_count_last10": median_view,
-                            "median_like_count_last10": median_like,
-                            "median_comment_count_last10": median_comment,
-                            "total_img_posts_ig": total_images,
-                            "total_reels_ig": total_reels,
-                        }
-                    )
+                    numeric_id = _canonical_int(lance_id) if lance_id else instagram_count + 1
+                    if numeric_id is None:
+                        if lance_id in used_other_ids:
+                            numeric_id = _next_free_id(instagram_count + 1)
+                        else:
+                            used_other_ids.add(lance_id)
+                            try:
+                                max_numeric_id = max(max_numeric_id, int(lance_id))
+                            except ValueError:
+                                pass
+                    elif numeric_id in used_numeric_ids:
+                        numeric_id = _next_free_id(instagram_count + 1)
+                    if numeric_id is not None:
+                        used_numeric_ids.add(numeric_id)
+                        max_numeric_id = max(max_numeric_id, numeric_id)
+                        lance_id = str(numeric_id)
+
+                    writer.writerow((lance_id, *fields))
                     instagram_count += 1
 
         starting_lance_id = max_numeric_id + 1 if max_numeric_id > 0 else instagram_count + 1
         print("   📥 Processing TikTok file: tiktok.csv")
-        with tiktok_file.open("r", encoding="utf-8") as fh:
+        with tiktok_file.open("r", encoding="utf-8", buffering=CSV_IO_BUFFER_BYTES) as fh:
             reader = csv.DictReader(fh)
-            for offset, raw in enumerate(tqdm(reader, desc="TikTok", unit="rows")):
-                lance_id = str(starting_lance_id + offset)
-                while lance_id in used_ids:
+            rows = tqdm(reader, desc="TikTok", unit="rows")
+            for offset, (_, fields) in enumerate(
+                _iter_processed_rows(rows, _process_tiktok_row, executor)
+            ):
+                while starting_lance_id + offset in used_numeric_ids:
                     starting_lance_id += 1
-                    lance_id = str(starting_lance_id + offset)
-                used_ids.add(lance_id)
-
-                merged_posts = _merge_tiktok_posts(raw)
-                posts_json = _normalize_posts(merged_posts, "tiktok")
-                reel_ratio, median_view, median_like, median_comment = _compute_post_statistics(posts_json)
-
-                writer.writerow(
-                    {
-                        "lance_db_id": lance_id,
-                        "platform": "tiktok",
-                        "platform_id": raw.get("id", ""),
-                        "username": raw.get("account_id", ""),
-                        "display_name": raw.get("profile_name") or raw.get("nickname", ""),
-                        "biography": raw.get("biography") or raw.get("signature", ""),
-                        "followers": raw.get("followers", ""),
-                        "following": raw.get("following", ""),
-                        "posts_count": raw.get("videos_count", ""),
-                        "likes_total": raw.get("likes", ""),
-                        "engagement_rate": raw.get("awg_engagement_rate", ""),
-                        "external_url": raw.get("bio_link", ""),
-                        "profile_url": raw.get("url", ""),
-                        "profile_image_url": raw.get("profile_pic_url_hd", raw.get("profile_pic_url", "")),
-                        "is_verified": _parse_bool(raw.get("is_verified")),
-                        "is_private": _parse_bool(raw.get("is_private")),
-                        "is_commerce_user": _parse_bool(raw.get("is_commerce_user")),
-                        "posts": posts_json,
-                        "reel_post_ratio_last10": reel_ratio,
-                        "median_view_count_last10": median_view,
-                        "median_like_count_last10": median_like,
-                        "median_comment_count_last10": median_comment,
-                        "total_img_posts_ig": "",
-                        "total_reels_ig": "",
-                    }
-                )
+                used_numeric_ids.add(starting_lance_id + offset)
+                lance_id = str(starting_lance_id + offset)
+
+                writer.writerow((lance_id, *fields))
                 tiktok_count += 1
 
     print(
@@ -722,6 +1052,432 @@ def combine_platform_datasets(root_dir: Path) -> Path:
     return output_file
 
 
+def _build_language_sample_text(row: Dict[str, str], posts: Any = None) -> str:
+    biography = row.get("biography", "") or ""
+    snippets: List[str] = []
+
+    if posts is None:
+        posts_raw = row.get("posts", "") or ""
+        if posts_raw:
+            try:
+                posts = _json_loads(posts_raw)
+            except json.JSONDecodeError:
+                posts = None
+    if isinstance(posts, list):
+        for post in posts[:CAPTIONS_TO_INSPECT]:
+            caption = ""
+            if isinstance(post, dict):
+                caption = str(post.get("caption", ""))
+            elif isinstance(post, str):
+                caption = post
+            caption = caption.strip()
+            if caption:
+                snippets.append(caption[:CAPTION_SNIPPET_CHARS])
+
+    text_parts = [biography.strip()] if biography.strip() else []
+    text_parts.extend(snippets)
+    return " ".join(text_parts).strip()
+
+
+@lru_cache(maxsize=POSTS_MEMO_SIZE)
+def _normalize_posts_payload(
+    posts_raw: str, platform_hint: str
+) -> Tuple[Any, str, Tuple[str, str, str, str, str, str]]:
+    """Normalized posts, their JSON and last-10 stats for one raw ``posts`` cell.
+
+    Memoized on the raw text: dormant and duplicated profiles repeat the same
+    payload, and the returned posts list is only ever read.
+    """
+    try:
+        posts: Any = _normalize_post_entries(posts_raw, platform_hint or "generic")
+    except Exception:
+        posts = _safe_json_loads(posts_raw)
+    return posts, _json_dumps(posts), _summarize_posts(posts, platform_hint == "instagram")
+
+
+def _normalize_profile_row(row: Dict[str, str]) -> Tuple[Dict[str, str], Any]:
+    """Normalize ``row`` and also return its decoded posts (``None`` if empty)."""
+    normalized = dict(row)
+    posts: Any = None
+
+    biography = normalized.get("biography")
+    if isinstance(biography, str):
+        normalized["biography"] = _decode_text(biography)
+
+    platform_hint_candidates = (
+        normalized.get("platform"),
+        normalized.get("platform_type"),
+        normalized.get("source_platform"),
+        normalized.get("platform_name"),
+    )
+    platform_hint = next(
+        (str(value).strip().lower() for value in platform_hint_candidates if value),
+        "",
+    )
+
+    posts_raw = normalized.get("posts")
+    if posts_raw not in (None, ""):
+        posts, normalized["posts"], stats = _normalize_posts_payload(posts_raw, platform_hint)
+        (
+            normalized["reel_post_ratio_last10"],
+            normalized["median_view_count_last10"],
+            normalized["median_like_count_last10"],
+            normalized["median_comment_count_last10"],
+            normalized["total_img_posts_ig"],
+            normalized["total_reels_ig"],
+        ) = stats
+    else:
+        normalized["reel_post_ratio_last10"] = ""
+        normalized["median_view_count_last10"] = ""
+        normalized["median_like_count_last10"] = ""
+        normalized["median_comment_count_last10"] = ""
+        normalized["total_img_posts_ig"] = ""
+        normalized["total_reels_ig"] = ""
+
+    for field in _ESCAPED_TEXT_FIELDS:
+        value = normalized.get(field)
+        if isinstance(value, str):
+            normalized[field] = value.strip()
+
+    return normalized, posts
+
+
+def _normalize_input_columns(row: Dict[str, str]) -> Dict[str, str]:
+    return {key: row[key] for key in NORMALIZE_INPUT_COLUMNS if key in row}
+
+
+def _normalize_language_row(row: Dict[str, str]) -> Tuple[Dict[str, str], str]:
+    normalized, posts = _normalize_profile_row(row)
+    return normalized, _build_language_sample_text(normalized, posts)
+
+
+@lru_cache(maxsize=256)
+def _relative_display_path(path: Path, bases: Tuple[Path, ...]) -> str:
+    for base in bases:
+        try:
+            return str(path.relative_to(base))
+        except ValueError:
+            continue
+    return str(path)
+
+
+def _prompt_template_fields(template: str) -> Optional[frozenset]:
+    """Return the context keys ``template`` formats, or ``None`` to use it verbatim.
+
+    Mirrors the old per-row ``format(**context)`` fallback: a template naming a
+    key outside ``PROMPT_CONTEXT_KEYS`` is sent unformatted.
+    """
+    fields = set()
+    for _, field_name, _, _ in string.Formatter().parse(template):
+        if field_name is None:
+            continue
+        fields.add(re.split(r"[.\[]", field_name, maxsplit=1)[0])
+    if fields - PROMPT_CONTEXT_KEYS:
+        return None
+    return frozenset(fields)
+
+
+@lru_cache(maxsize=POSTS_MEMO_SIZE)
+def _prompt_post_context(posts_raw: str) -> Tuple[str, str]:
+    caption_location_pairs: List[str] = []
+    location_summary: List[str] = []
+    if posts_raw:
+        try:
+            posts = _json_loads(posts_raw)
+            if isinstance(posts, list):
+                for post in posts[:CAPTIONS_TO_INSPECT]:
+                    caption = ""
+                    location_name = ""
+                    if isinstance(post, dict):
+                        caption = str(post.get("caption", ""))
+                        raw_location = post.get("location_name")
+                        if not raw_location and isinstance(post.get("location"), dict):
+                            raw_location = post.get("location", {}).get("name")
+                        if isinstance(raw_location, str):
+                            location_name = _decode_text(raw_location).strip()
+                            if location_name and location_name not in location_summary:
+                                location_summary.append(location_name)
+                    elif isinstance(post, str):
+                        caption = post
+
+                    caption = caption.strip()
+                    if caption:
+                        if location_name:
+                            caption_location_pairs.append(
+                                f"Post: {caption} (Location: {location_name})"
+                            )
+                        else:
+                            caption_location_pairs.append(
+                                f"Post: {caption} (Location: Unknown)"
+                            )
+        except json.JSONDecodeError:
+            trimmed = posts_raw[:200]
+            caption_location_pairs.append(f"Post: {trimmed} (Location: Unknown)")
+
+    return (
+        " | ".join(caption_location_pairs),
+        " | ".join(location_summary) if location_summary else "Unknown",
+    )
+
+
+class _FastTextDetector:
+    """Adapter exposing the lingua detector API on top of FastText ``lid.176``."""
+
+    def __init__(self, model_path: Path) -> None:
+        self.model = fasttext.load_model(str(model_path))
+
+    def detect_languages_in_parallel_of(self, texts: Sequence[str]) -> List[Optional[Language]]:
+        # predict() rejects newlines, and a single call scores the whole batch in C++
+        labels, _ = self.model.predict([text.replace("\n", " ") for text in texts], k=1)
+        return [Language.ENGLISH if label and label[0] == "__label__en" else None for label in labels]
+
+    def detect_language_of(self, text: str) -> Optional[Language]:
+        return self.detect_languages_in_parallel_of([text])[0]
+
+
+_KEYWORD_FIELDS = tuple(f"keyword{i}" for i in range(1, 11))
+# Parsed-response columns for rows whose model output could not be used
+_EMPTY_PARSED_RESPONSE = MappingProxyType(
+    {
+        "individual_vs_org": None,
+        "generational_appeal": None,
+        "professionalization": None,
+        "relationship_status": None,
+        "location": "",
+        "ethnicity": "",
+        "age": "",
+        "occupation": "",
+        **dict.fromkeys(_KEYWORD_FIELDS, ""),
+    }
+)
+
+
+def _parse_score(raw: str) -> Optional[int]:
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        # Scores are almost always bare digits, which need no float round-trip
+        if raw.isdecimal():
+            return min(10, int(raw))
+        val = int(round(float(raw)))
+        return max(0, min(10, val))
+    except ValueError:
+        return None
+
+
+def _parse_response_text(text: str) -> Dict[str, Optional[str]]:
+    if not text:
+        return dict(_EMPTY_PARSED_RESPONSE, processing_error="empty_response")
+
+    # Blank lines hold no comma, so the text itself needs no strip first
+    for line in text.splitlines():
+        if "," in line:
+            candidate_line = line.strip()
+            break
+    else:
+        candidate_line = text.strip()
+
+    if '"' not in candidate_line:
+        # Unquoted model output splits exactly like csv.reader would
+        values = candidate_line.split(",")
+    else:
+        reader = csv.reader([candidate_line])
+        try:
+            values = next(reader)
+        except Exception:
+            return dict(_EMPTY_PARSED_RESPONSE, processing_error="csv_parse_error")
+
+    if len(values) < 18:
+        return dict(_EMPTY_PARSED_RESPONSE, processing_error=f"unexpected_value_count:{len(values)}")
+
+    individual_vs_org = _parse_score(values[0])
+    generational_appeal = _parse_score(values[1])
+    professionalization = _parse_score(values[2])
+    relationship_status = _parse_score(values[3])
+    missing_scores = (
+        individual_vs_org is None
+        or generational_appeal is None
+        or professionalization is None
+        or relationship_status is None
+    )
+
+    result = {
+        "individual_vs_org": individual_vs_org,
+        "generational_appeal": generational_appeal,
+        "professionalization": professionalization,
+        "relationship_status": relationship_status,
+        "location": values[4].strip(),
+        "ethnicity": values[5].strip(),
+        "age": values[6].strip(),
+        "occupation": values[7].strip(),
+        "processing_error": "missing_scores" if missing_scores else "",
+    }
+    result.update(zip(_KEYWORD_FIELDS, (value.strip() for value in values[8:18])))
+    return result
+
+
+def _openai_api_key() -> str:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError(
+            "OPENAI_API_KEY is not set. Please add it to your environment or .env file."
+        )
+    return api_key
+
+
+def _raw_line_excerpt(line: bytes, limit: int = 500) -> str:
+    """Return the first ``limit`` characters of a raw JSONL line.
+
+    Only a bounded prefix is decoded; a UTF-8 character is at most 4 bytes.
+    """
+    return line.strip()[: limit * 4].decode("utf-8", "replace")[:limit]
+
+
+def _response_output_text(response_body: Dict[str, Any]) -> str:
+    """Return the ``output_text`` of a Responses API body ("" when absent)."""
+    # Nearly every body is a single message whose first part is the text
+    try:
+        outputs = response_body["output"]
+        message = outputs[0]
+        part = message["content"][0]
+        if len(outputs) == 1 and message["type"] == "message" and part["type"] == "output_text":
+            return part.get("text", "")
+    except (KeyError, IndexError, TypeError):
+        pass
+
+    text_content = ""
+    for output in response_body.get("output", []):
+        if output.get("type") == "message":
+            for part in output.get("content", []):
+                if part.get("type") == "output_text":
+                    text_content = part.get("text", "")
+                    break
+    return text_content
+
+
+def _write_result_rows(
+    lines: Iterable[bytes], chunk_index: int, csv_target: Path, prompt_file_name: str
+) -> Path:
+    """Parse batch result JSONL ``lines`` (raw bytes) into the chunk CSV.
+
+    Rows are written as they are parsed into a ``.part`` file that only
+    replaces ``csv_target`` once every line is done; an existing chunk CSV
+    marks the chunk as finished.
+    """
+    source_batch = f"batch_{chunk_index:03d}"
+    partial_target = csv_target.with_suffix(".csv.part")
+    with partial_target.open("w", encoding="utf-8", newline="", buffering=CSV_WRITE_BUFFER_BYTES) as out_fh:
+        writer = csv.writer(out_fh)
+        writer.writerow(CSV_FIELD_ORDER)
+        # Raw bytes go straight to orjson; only malformed lines are decoded here
+        for line_num, line in enumerate(lines, start=1):
+            if not line or line.isspace():
+                continue
+            try:
+                payload = _json_loads(line)
+            except json.JSONDecodeError:
+                parsed: Dict[str, Optional[str]] = {
+                    "lance_db_id": "",
+                    "raw_response": _raw_line_excerpt(line),
+                    "processing_error": f"json_decode_error_line_{line_num}",
+                    "source_batch": source_batch,
+                    "prompt_file": prompt_file_name,
+                }
+                writer.writerow(tuple(parsed.get(key, "") for key in CSV_FIELD_ORDER))
+                continue
+
+            custom_id = payload.get("custom_id", "")
+            lance_db_id = custom_id.replace("profile-", "") if custom_id.startswith("profile-") else ""
+
+            parsed = {
+                "lance_db_id": lance_db_id,
+                "raw_response": "",
+                "processing_error": "",
+                "source_batch": source_batch,
+                "prompt_file": prompt_file_name,
+            }
+
+            if payload.get("response") and payload["response"].get("status_code") == 200:
+                text_content = _response_output_text(payload["response"].get("body", {}))
+                parsed.update(_parse_response_text(text_content))
+                parsed["raw_response"] = text_content
+            else:
+                error = payload.get("error") or payload.get("response", {}).get("status_code")
+                parsed["processing_error"] = f"api_error:{error}"
+                parsed["raw_response"] = _raw_line_excerpt(line)
+
+            writer.writerow(tuple(parsed.get(key, "") for key in CSV_FIELD_ORDER))
+    os.replace(partial_target, csv_target)
+    return csv_target
+
+
+def _iter_mapped_lines(path: Path) -> Iterator[bytes]:
+    """Yield the lines of ``path`` as bytes, scanning a memory map with find()."""
+    with path.open("rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            size = len(mapped)
+            while start < size:
+                end = mapped.find(b"\n", start)
+                if end == -1:
+                    end = size
+                yield mapped[start:end]
+                start = end + 1
+
+
+def _process_result_file(chunk_index: int, results_path: Path, csv_target: Path, prompt_file_name: str) -> Path:
+    """Parse one downloaded batch results JSONL into its chunk CSV."""
+    return _write_result_rows(_iter_mapped_lines(results_path), chunk_index, csv_target, prompt_file_name)
+
+
+def _iter_byte_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    pending = b""
+    for chunk in chunks:
+        pending += chunk
+        *complete, pending = pending.split(b"\n")
+        yield from complete
+    if pending:
+        yield pending
+
+
+def _fetch_and_process_results(
+    chunk_index: int,
+    output_file_id: str,
+    results_path: Path,
+    csv_target: Path,
+    prompt_file_name: str,
+) -> Path:
+    """Stream a batch output file from OpenAI straight into its chunk CSV.
+
+    The raw JSONL is teed to ``results_path`` as it arrives, so a later run
+    can re-parse without downloading again; it is never read back here.
+    """
+    if results_path.exists():
+        return _process_result_file(chunk_index, results_path, csv_target, prompt_file_name)
+
+    client = OpenAI(api_key=_openai_api_key())
+    partial_path = results_path.with_suffix(".jsonl.part")
+
+    def _tee(chunks: Iterable[bytes], raw_fh: Any) -> Iterator[bytes]:
+        for chunk in chunks:
+            raw_fh.write(chunk)
+            yield chunk
+
+    with (
+        client.files.with_streaming_response.content(output_file_id) as response,
+        partial_path.open("wb", buffering=RESULTS_DOWNLOAD_CHUNK_BYTES) as raw_fh,
+    ):
+        chunks = response.iter_bytes(chunk_size=RESULTS_DOWNLOAD_CHUNK_BYTES)
+        lines = _iter_byte_lines(_tee(chunks, raw_fh))
+        _write_result_rows(lines, chunk_index, csv_target, prompt_file_name)
+    os.replace(partial_path, results_path)
+    print(f"      💾 Results downloaded to {results_path.name}")
+    return csv_target
+
+
 @dataclass
 class ChunkInfo:
     index: int
@@ -742,6 +1498,25 @@ class BatchJobRecord:
     result_csv: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class PipelineOptions:
+    """Settings shared by every CSV pipeline of one run, resolved once from the CLI."""
+
+    chunk_size: int
+    language_batch_size: int
+    poll_interval: int
+    max_attempts: int
+    stop_after: Optional[str]
+    resume_from: str
+    test_mode: bool
+    min_text_chars: int
+    prompt_file: Path
+    force: bool
+    process_workers: int
+    language_backend: str
+    fasttext_model: Path
+
+
 class SequentialBatchPipeline:
     @staticmethod
     def _make_namespace(name: str) -> str:
@@ -763,6 +1538,9 @@ class SequentialBatchPipeline:
         prompt_file: Path,
         force: bool,
         dataset_namespace: Optional[str] = None,
+        process_workers: int = 1,
+        language_backend: str = "lingua",
+        fasttext_model: Optional[Path] = None,
     ) -> None:
         self.original_csv_path = csv_path.resolve()
         if not self.original_csv_path.exists():
@@ -779,10 +1557,13 @@ class SequentialBatchPipeline:
         self.max_attempts = max_attempts
         self.stop_after = stop_after
         self.resume_from = resume_from
+        self._stop_order = STEP_ORDER[stop_after] if stop_after is not None else None
+        self._resume_order = STEP_ORDER[resume_from]
         self.test_mode = test_mode
         self.min_text_chars = min_text_chars
         self.max_rows = 500 if test_mode else None
         self.force = force
+        self.process_workers = max(1, process_workers)
 
         # Shared pipeline directories under project root
         self.project_root = Path(__file__).resolve().parent
@@ -805,7 +1586,10 @@ class SequentialBatchPipeline:
         ):
             path.mkdir(parents=True, exist_ok=True)
 
+        self.language_cache_path = self.language_dir / f"{self.namespace}_lang_cache.json"
         self.job_state_path = self.pipeline_dir / f"{self.namespace}_batch_jobs_state.json"
+        # Last serialized job state written to disk, so unchanged state is not rewritten
+        self._job_state_snapshot: Optional[str] = None
         if self.job_state_path.exists():
             try:
                 with self.job_state_path.open("r", encoding="utf-8") as fh:
@@ -833,18 +1617,33 @@ class SequentialBatchPipeline:
         self.file_hash = self._hash_file(self.original_csv_path)
         print("🧠 Initializing language detector")
 
-        self.detector = (
-            LanguageDetectorBuilder.from_all_languages()
-            .with_preloaded_language_models()
-            .build()
-        )
-        print("   ✅ Language detector ready (Lingua, preloaded models)")
+        if language_backend not in LANGUAGE_BACKENDS:
+            raise ValueError(f"Unknown language backend: {language_backend}")
+        self.language_backend = language_backend
+        if language_backend == "fasttext":
+            if fasttext is None:
+                raise RuntimeError(
+                    "The fasttext backend requires the fasttext package. Install it with `pip install fasttext`."
+                )
+            model_path = (fasttext_model or self.project_root / DEFAULT_FASTTEXT_MODEL).resolve()
+            if not model_path.exists():
+                raise FileNotFoundError(f"FastText language model not found: {model_path}")
+            self.detector = _FastTextDetector(model_path)
+            print(f"   ✅ Language detector ready (FastText, {model_path.name})")
+        else:
+            self.detector = (
+                LanguageDetectorBuilder.from_all_languages()
+                .with_preloaded_language_models()
+                .build()
+            )
+            print("   ✅ Language detector ready (Lingua, preloaded models)")
 
         self.prompt_file_path = prompt_file.resolve()
         if not self.prompt_file_path.exists():
             raise FileNotFoundError(f"Prompt file not found: {self.prompt_file_path}")
         self.prompt_file_name = self.prompt_file_path.name
         self.prompt_template = self.prompt_file_path.read_text(encoding="utf-8")
+        self.prompt_fields = _prompt_template_fields(self.prompt_template)
 
         self.client: Optional[OpenAI] = None
         self.language_pass_count: int = 0
@@ -858,119 +1657,62 @@ class SequentialBatchPipeline:
     def _get_client(self) -> OpenAI:
         if self.client is None:
             print("⚙️  Initializing OpenAI client for batch processing")
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                raise RuntimeError(
-                    "OPENAI_API_KEY is not set. Please add it to your environment or .env file."
-                )
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=_openai_api_key())
         return self.client
 
-    def _build_language_sample(self, row: Dict[str, str]) -> str:
-        biography = row.get("biography", "") or ""
-        posts_raw = row.get("posts", "") or ""
-        snippets: List[str] = []
-
-        if posts_raw:
-            try:
-                posts = json.loads(posts_raw)
-                if isinstance(posts, list):
-                    for post in posts[:CAPTIONS_TO_INSPECT]:
-                        caption = ""
-                        if isinstance(post, dict):
-                            caption = str(post.get("caption", ""))
-                        elif isinstance(post, str):
-                            caption = post
-                        caption = caption.strip()
-                        if caption:
-                            snippets.append(caption[:CAPTION_SNIPPET_CHARS])
-            except json.JSONDecodeError:
-                pass
-
-        text_parts = [biography.strip()] if biography.strip() else []
-        text_parts.extend(snippets)
-        return " ".join(text_parts).strip()
+    def _build_language_sample(self, row: Dict[str, str], posts: Any = None) -> str:
+        return _build_language_sample_text(row, posts)
 
-    def _normalize_row(self, row: Dict[str, str]) -> Dict[str, str]:
-        normalized = dict(row)
+    def _normalize_row(self, row: Dict[str, str]) -> Tuple[Dict[str, str], Any]:
+        return _normalize_profile_row(row)
 
-        biography = normalized.get("biography")
-        if isinstance(biography, str):
-            normalized["biography"] = _decode_text(biography)
-
-        platform_hint_candidates = (
-            normalized.get("platform"),
-            normalized.get("platform_type"),
-            normalized.get("source_platform"),
-            normalized.get("platform_name"),
-        )
-        platform_hint = next(
-            (str(value).strip().lower() for value in platform_hint_candidates if value),
-            "",
-        )
-
-        posts_raw = normalized.get("posts")
-        if posts_raw not in (None, ""):
-            try:
-                normalized_posts = _normalize_posts(posts_raw, platform_hint or "generic")
-            except Exception:
-                normalized_posts = json.dumps(_safe_json_loads(posts_raw), ensure_ascii=False)
-            normalized["posts"] = normalized_posts
-
-            reel_ratio, median_view, median_like, median_comment = _compute_post_statistics(normalized_posts)
-            normalized["reel_post_ratio_last10"] = reel_ratio
-            normalized["median_view_count_last10"] = median_view
-            normalized["median_like_count_last10"] = median_like
-            normalized["median_comment_count_last10"] = median_comment
-
-            if platform_hint == "instagram":
-                total_images, total_reels = _count_instagram_media(normalized_posts)
-            else:
-                total_images, total_reels = "", ""
-            normalized["total_img_posts_ig"] = total_images
-            normalized["total_reels_ig"] = total_reels
-        else:
-            normalized["reel_post_ratio_last10"] = ""
-            normalized["median_view_count_last10"] = ""
-            normalized["median_like_count_last10"] = ""
-            normalized["median_comment_count_last10"] = ""
-            normalized["total_img_posts_ig"] = ""
-            normalized["total_reels_ig"] = ""
-
-        text_fields = [
-            "profile_name",
-            "full_name",
-            "account",
-            "business_category_name",
-            "category_name",
-            "external_url",
-            "bio_hashtags",
-            "business_email",
-            "email_address",
-            "location",
-        ]
-        for field in text_fields:
-            value = normalized.get(field)
-            if isinstance(value, str):
-                normalized[field] = _decode_text(value)
-
-        return normalized
+    def _detect_languages(self, texts: Sequence[str]) -> List[Optional[Language]]:
+        # Lingua >= 1.3 fans the batch out across Rust threads without the GIL;
+        # older releases and the fallback detector only expose the scalar API.
+        detect_parallel = getattr(self.detector, "detect_languages_in_parallel_of", None)
+        if detect_parallel is not None:
+            return list(detect_parallel(list(texts)))
+        return [self.detector.detect_language_of(text) for text in texts]
 
     def _needs_language_detection(self, sample_text: str) -> bool:
         return bool(sample_text) and len(sample_text) >= self.min_text_chars
 
-    def _should_keep_row(self, sample_text: str, detected_language: Optional[Language] = None) -> bool:
+    def _should_keep_row(self, sample_text: str, is_english: bool = False) -> bool:
         if not self._needs_language_detection(sample_text):
             return True
-        return detected_language == Language.ENGLISH
+        return is_english
+
+    def _language_cache_tag(self) -> str:
+        detector_type = type(self.detector)
+        return f"{LANGUAGE_FILTER_VERSION}:{detector_type.__module__}.{detector_type.__qualname__}"
+
+    def _load_language_cache(self) -> Dict[str, bool]:
+        if not self.language_cache_path.exists():
+            return {}
+        try:
+            with self.language_cache_path.open("r", encoding="utf-8") as fh:
+                payload = json.load(fh)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("tag") != self._language_cache_tag():
+            return {}
+        decisions = payload.get("decisions")
+        return decisions if isinstance(decisions, dict) else {}
+
+    def _save_language_cache(self, decisions: Dict[str, bool]) -> None:
+        tmp_path = self.language_cache_path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            json.dump({"tag": self._language_cache_tag(), "decisions": decisions}, fh)
+        os.replace(tmp_path, self.language_cache_path)
 
     def _write_csv(self, path: Path, header: Sequence[str], rows: Sequence[Dict[str, str]]) -> None:
         with path.open("w", encoding="utf-8", newline="") as fh:
-            writer = csv.DictWriter(fh, fieldnames=header)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(row)
+            writer = csv.writer(fh)
+            writer.writerow(header)
+            fields = tuple(header)
+            writer.writerows([row.get(key, "") for key in fields] for row in rows)
 
+    @cached_property
     def _language_output_paths(self) -> Dict[str, Path]:
         suffix = "_sample" if self.test_mode else ""
         prefix = self.namespace
@@ -979,15 +1721,10 @@ class SequentialBatchPipeline:
         return {"english": english_path, "rejected": rejected_path}
 
     def _rel(self, path: Path) -> str:
-        for base in (self.dataset_dir, self.pipeline_root_dir, self.project_root):
-            try:
-                return str(path.relative_to(base))
-            except ValueError:
-                continue
-        return str(path)
+        return _relative_display_path(path, (self.dataset_dir, self.pipeline_root_dir, self.project_root))
 
     def _load_existing_filtered_csv(self) -> Path:
-        paths = self._language_output_paths()
+        paths = self._language_output_paths
         english_path = paths["english"]
         if not english_path.exists():
             raise FileNotFoundError(
@@ -1011,24 +1748,33 @@ class SequentialBatchPipeline:
             return sum(1 for _ in reader)
 
     def _record_job(self, job: BatchJobRecord) -> None:
-        state = {
-            "chunk_number": job.chunk_number,
-            "batch_id": job.batch_id,
-            "file_id": job.file_id,
-            "profile_count": job.profile_count,
-            "submitted_at": job.submitted_at,
-            "completed_at": job.completed_at,
-            "output_file_id": job.output_file_id,
-            "status": job.status,
-            "result_csv": job.result_csv,
-            "prompt_file": self.prompt_file_name,
-        }
-        self.job_state[str(job.chunk_number)] = state
+        self._record_jobs([job])
+
+    def _record_jobs(self, jobs: Iterable[BatchJobRecord]) -> None:
+        """Update the state of several jobs and persist them in one write."""
+        for job in jobs:
+            self.job_state[str(job.chunk_number)] = {
+                "chunk_number": job.chunk_number,
+                "batch_id": job.batch_id,
+                "file_id": job.file_id,
+                "profile_count": job.profile_count,
+                "submitted_at": job.submitted_at,
+                "completed_at": job.completed_at,
+                "output_file_id": job.output_file_id,
+                "status": job.status,
+                "result_csv": job.result_csv,
+                "prompt_file": self.prompt_file_name,
+            }
         self._persist_job_state()
 
     def _persist_job_state(self) -> None:
-        with self.job_state_path.open("w", encoding="utf-8") as fh:
-            json.dump(self.job_state, fh, indent=2, default=str)
+        snapshot = json.dumps(self.job_state, indent=2, default=str)
+        if snapshot == self._job_state_snapshot:
+            return
+        tmp_path = self.job_state_path.with_suffix(".json.tmp")
+        tmp_path.write_text(snapshot, encoding="utf-8")
+        os.replace(tmp_path, self.job_state_path)
+        self._job_state_snapshot = snapshot
 
     def _load_job(self, chunk_number: int) -> Optional[BatchJobRecord]:
         entry = self.job_state.get(str(chunk_number))
@@ -1049,10 +1795,31 @@ class SequentialBatchPipeline:
         )
 
     def _hash_file(self, path: Path) -> str:
-        digest = hashlib.sha256()
         with path.open("rb") as fh:
-            for chunk in iter(lambda: fh.read(1024 * 1024), b""):
-                digest.update(chunk)
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: hashed in C with the GIL released
+                return hashlib.file_digest(fh, "sha256").hexdigest()
+            digest = hashlib.sha256()
+            size = os.fstat(fh.fileno()).st_size
+            if size:
+                try:
+                    with (
+                        mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                        memoryview(mapped) as view,
+                    ):
+                        # One update over the mapped pages; no per-chunk Python loop
+                        digest.update(view)
+                    return digest.hexdigest()
+                except (OSError, OverflowError, ValueError):
+                    # e.g. 32-bit builds that cannot map multi-GB files
+                    digest = hashlib.sha256()
+            buffer = bytearray(HASH_READ_BUFFER_BYTES)
+            view = memoryview(buffer)
+            while True:
+                size = fh.readinto(buffer)
+                if not size:
+                    break
+                digest.update(view[:size])
         return digest.hexdigest()
 
     def _save_processed_files(self) -> None:
@@ -1097,22 +1864,22 @@ class SequentialBatchPipeline:
         return False
 
     def _ensure_lance_ids(self, csv_path: Path) -> Path:
-        with csv_path.open("r", encoding="utf-8", newline="") as fh:
-            reader = csv.DictReader(fh)
-            fieldnames = reader.fieldnames or []
-            rows = list(reader)
-
-        needs_rewrite = False
-        existing_ids: set[str] = set()
-        if "lance_db_id" not in fieldnames:
-            needs_rewrite = True
-        else:
-            for row in rows:
-                current_id = str(row.get("lance_db_id", "")).strip()
-                if not current_id or current_id in existing_ids:
-                    needs_rewrite = True
-                    break
-                existing_ids.add(current_id)
+        with csv_path.open("r", encoding="utf-8", newline="", buffering=CSV_IO_BUFFER_BYTES) as fh:
+            reader = csv.reader(fh)
+            fieldnames = next(reader, [])
+            needs_rewrite = "lance_db_id" not in fieldnames
+            if not needs_rewrite:
+                id_index = fieldnames.index("lance_db_id")
+                existing_ids: set[str] = set()
+                for row in reader:
+                    if not row:
+                        continue
+                    current_id = row[id_index].strip() if id_index < len(row) else ""
+                    if not current_id or current_id in existing_ids:
+                        needs_rewrite = True
+                        break
+                    existing_ids.add(current_id)
+                existing_ids.clear()
 
         if not needs_rewrite:
             return csv_path
@@ -1123,18 +1890,33 @@ class SequentialBatchPipeline:
         else:
             target_path = csv_path.with_name(base_name + "_with_lance_id.csv")
 
-        new_fieldnames = list(fieldnames)
-        if "lance_db_id" not in new_fieldnames:
-            new_fieldnames.insert(0, "lance_db_id")
-
-        with target_path.open("w", encoding="utf-8", newline="") as out_fh:
-            writer = csv.DictWriter(out_fh, fieldnames=new_fieldnames)
-            writer.writeheader()
-            for idx, row in enumerate(rows, start=1):
-                updated = {key: row.get(key, "") for key in fieldnames}
+        width = len(fieldnames)
+        insert_id = "lance_db_id" not in fieldnames
+        id_index = 0 if insert_id else fieldnames.index("lance_db_id")
+        # Written beside the target first since the source may be the target itself
+        tmp_path = target_path.with_suffix(".csv.tmp")
+        with (
+            csv_path.open("r", encoding="utf-8", newline="", buffering=CSV_IO_BUFFER_BYTES) as in_fh,
+            tmp_path.open("w", encoding="utf-8", newline="", buffering=CSV_WRITE_BUFFER_BYTES) as out_fh,
+        ):
+            reader = csv.reader(in_fh)
+            next(reader, None)
+            writer = csv.writer(out_fh)
+            writer.writerow(["lance_db_id", *fieldnames] if insert_id else fieldnames)
+            idx = 0
+            for row in reader:
+                if not row:
+                    continue
+                idx += 1
+                if len(row) != width:
+                    row = row[:width] + [""] * (width - len(row))
                 lance_id = f"{self.namespace}_{idx:06d}"
-                updated["lance_db_id"] = lance_id
-                writer.writerow(updated)
+                if insert_id:
+                    row.insert(0, lance_id)
+                else:
+                    row[id_index] = lance_id
+                writer.writerow(row)
+        os.replace(tmp_path, target_path)
 
         return target_path
 
@@ -1148,7 +1930,7 @@ class SequentialBatchPipeline:
     # ------------------------------------------------------------------ step 0
     def perform_language_filter(self) -> Path:
         print("\n🧪 Step 0: Language filtering")
-        paths = self._language_output_paths()
+        paths = self._language_output_paths
         english_path = paths["english"]
         rejected_path = paths["rejected"]
         metadata_path = self.language_dir / "metadata.json"
@@ -1163,6 +1945,7 @@ class SequentialBatchPipeline:
                 metadata.get("hash") == self.file_hash
                 and metadata.get("version") == LANGUAGE_FILTER_VERSION
                 and metadata.get("language_batch_size") == self.language_batch_size
+                and metadata.get("language_backend", "lingua") == self.language_backend
             ):
                 reuse_cached = True
 
@@ -1178,16 +1961,15 @@ class SequentialBatchPipeline:
             english_rows = 0
             rejected_rows = 0
 
-            with (
-                self.original_csv_path.open("r", encoding="utf-8", newline="") as fh,
-                english_path.open("w", encoding="utf-8", newline="") as english_fh,
-                rejected_path.open("w", encoding="utf-8", newline="") as rejected_fh,
-            ):
+            source_header, reader = _open_csv_records(self.original_csv_path)
+            if source_header is None:
+                raise ValueError("Input CSV has no header row")
 
-                reader = csv.DictReader(fh)
-                if reader.fieldnames is None:
-                    raise ValueError("Input CSV has no header row")
-                header = list(reader.fieldnames)
+            with ExitStack() as stack:
+                english_fh = stack.enter_context(english_path.open("w", encoding="utf-8", newline=""))
+                rejected_fh = stack.enter_context(rejected_path.open("w", encoding="utf-8", newline=""))
+
+                header = list(source_header)
                 enrichment_fields = [
                     "reel_post_ratio_last10",
                     "median_view_count_last10",
@@ -1199,39 +1981,61 @@ class SequentialBatchPipeline:
                 for field in enrichment_fields:
                     if field not in header:
                         header.append(field)
-                english_writer = csv.DictWriter(english_fh, fieldnames=header)
-                rejected_writer = csv.DictWriter(rejected_fh, fieldnames=header)
-                english_writer.writeheader()
-                rejected_writer.writeheader()
-
+                fields = tuple(header)
+                english_writer = csv.writer(english_fh)
+                rejected_writer = csv.writer(rejected_fh)
+                english_writer.writerow(fields)
+                rejected_writer.writerow(fields)
+
+                language_cache = self._load_language_cache()
+                unsaved_decisions = 0
                 batch_rows: List[Dict[str, str]] = []
                 batch_samples: List[str] = []
                 batch_detection_inputs: List[str] = []
                 batch_detection_positions: List[int] = []
 
                 def _process_batch() -> None:
-                    nonlocal english_rows, rejected_rows
+                    nonlocal english_rows, rejected_rows, unsaved_decisions
                     if not batch_rows:
                         return
                     batch_total = len(batch_rows)
-                    detected: Dict[int, Optional[Language]] = {}
-                    if batch_detection_inputs:
+                    detected: Dict[int, bool] = {}
+                    pending_positions: List[int] = []
+                    pending_inputs: List[str] = []
+                    pending_keys: List[str] = []
+                    for idx_position, sample_text in zip(batch_detection_positions, batch_detection_inputs):
+                        key = _language_cache_key(sample_text)
+                        cached = language_cache.get(key)
+                        if cached is None:
+                            pending_positions.append(idx_position)
+                            pending_inputs.append(sample_text)
+                            pending_keys.append(key)
+                        else:
+                            detected[idx_position] = cached
+                    if pending_inputs:
                         print(
                             "   🔄 Language detection for "
-                            f"{len(batch_detection_inputs)} of {batch_total} normalized rows"
+                            f"{len(pending_inputs)} of {batch_total} normalized rows "
+                            f"({len(batch_detection_inputs) - len(pending_inputs)} cached)"
                         )
-                        languages = self.detector.detect_languages_in_parallel_of(batch_detection_inputs)
-                        for idx_position, language in zip(batch_detection_positions, languages):
-                            detected[idx_position] = language
+                        languages = self._detect_languages(pending_inputs)
+                        for idx_position, key, language in zip(pending_positions, pending_keys, languages):
+                            is_english = language == Language.ENGLISH
+                            detected[idx_position] = is_english
+                            language_cache[key] = is_english
+                        unsaved_decisions += len(pending_inputs)
+                        if unsaved_decisions >= LANGUAGE_CACHE_FLUSH_ROWS:
+                            self._save_language_cache(language_cache)
+                            unsaved_decisions = 0
 
                     for position, row in enumerate(batch_rows):
                         sample_text = batch_samples[position]
-                        language = detected.get(position)
-                        if self._should_keep_row(sample_text, language):
-                            english_writer.writerow(row)
+                        values = [row.get(key, "") for key in fields]
+                        if self._should_keep_row(sample_text, detected.get(position, False)):
+                            english_writer.writerow(values)
                             english_rows += 1
                         else:
-                            rejected_writer.writerow(row)
+                            rejected_writer.writerow(values)
                             rejected_rows += 1
 
                     batch_rows.clear()
@@ -1242,13 +2046,22 @@ class SequentialBatchPipeline:
                 progress_total = self.max_rows if self.max_rows else None
                 scan_progress = tqdm(total=progress_total, desc="Language scan", unit="rows")
 
-                try:
-                    for idx, row in enumerate(reader, start=1):
-                        if self.max_rows and idx > self.max_rows:
-                            break
+                rows: Iterable[Dict[str, str]] = reader
+                if self.max_rows:
+                    rows = islice(rows, self.max_rows)
 
-                        normalized_row = self._normalize_row(dict(row))
-                        sample_text = self._build_language_sample(normalized_row)
+                try:
+                    executor = (
+                        stack.enter_context(ProcessPoolExecutor(max_workers=self.process_workers))
+                        if self.process_workers > 1
+                        else None
+                    )
+                    processed = _iter_processed_rows(
+                        rows, _normalize_language_row, executor, project=_normalize_input_columns
+                    )
+                    for idx, (raw, (normalized_fields, sample_text)) in enumerate(processed, start=1):
+                        # Passthrough columns never leave this process; only normalized ones are merged back
+                        normalized_row = {**raw, **normalized_fields}
                         batch_rows.append(normalized_row)
                         batch_samples.append(sample_text)
                         if self._needs_language_detection(sample_text):
@@ -1268,6 +2081,8 @@ class SequentialBatchPipeline:
                         print(f"   … Final batch of {len(batch_rows)} rows")
                         _process_batch()
                 finally:
+                    if unsaved_decisions:
+                        self._save_language_cache(language_cache)
                     if hasattr(scan_progress, "close"):
                         scan_progress.close()
 
@@ -1277,6 +2092,7 @@ class SequentialBatchPipeline:
                 "rows": english_rows,
                 "version": LANGUAGE_FILTER_VERSION,
                 "language_batch_size": self.language_batch_size,
+                "language_backend": self.language_backend,
             }
             metadata_path.write_text(json.dumps(metadata, indent=2))
 
@@ -1297,29 +2113,25 @@ class SequentialBatchPipeline:
     def prepare_batches(self) -> List[ChunkInfo]:
         assert self.filtered_csv_with_ids is not None
         print("\n📦 Step 1: Preparing batch input files")
-        chunk_rows: List[Dict[str, str]] = []
         chunk_infos: List[ChunkInfo] = []
+        total_rows = self.language_pass_count or self._count_rows(self.filtered_csv_with_ids)
 
         with self.filtered_csv_with_ids.open("r", encoding="utf-8", newline="") as fh:
             reader = csv.DictReader(fh)
-            current_chunk = 1
-            for row in reader:
-                chunk_rows.append(row)
-                if len(chunk_rows) == self.chunk_size:
-                    info = self._write_chunk_jsonl(current_chunk, chunk_rows)
+            for current_chunk, start in enumerate(range(0, total_rows, self.chunk_size), start=1):
+                expected_rows = min(self.chunk_size, total_rows - start)
+                info = self._write_chunk_jsonl(current_chunk, islice(reader, expected_rows), expected_rows)
+                if info.row_count:
                     chunk_infos.append(info)
-                    chunk_rows = []
-                    current_chunk += 1
-
-            if chunk_rows:
-                info = self._write_chunk_jsonl(current_chunk, chunk_rows)
-                chunk_infos.append(info)
 
         print(f"   ✅ Prepared {len(chunk_infos)} batch input file(s) in {self._rel(self.batch_input_dir)}")
         self.chunk_infos = chunk_infos
         return chunk_infos
 
-    def _write_chunk_jsonl(self, chunk_index: int, rows: Sequence[Dict[str, str]]) -> ChunkInfo:
+    def _write_chunk_jsonl(
+        self, chunk_index: int, rows: Iterable[Dict[str, str]], expected_rows: int
+    ) -> ChunkInfo:
+        """Stream ``rows`` into one JSONL request file, one line per row."""
         jsonl_path = self.batch_input_dir / f"{self.namespace}_batch_{chunk_index:03d}.jsonl"
         metadata_path = self.batch_input_dir / f"{self.namespace}_batch_{chunk_index:03d}.metadata.json"
 
@@ -1331,11 +2143,14 @@ class SequentialBatchPipeline:
             except json.JSONDecodeError:
                 saved_rows = None
                 saved_prompt = None
-            if saved_rows == len(rows) and saved_prompt == self.prompt_file_name:
-                return ChunkInfo(index=chunk_index, jsonl_path=jsonl_path, row_count=len(rows))
+            if saved_rows == expected_rows and saved_prompt == self.prompt_file_name:
+                deque(rows, maxlen=0)  # advance the shared reader past this chunk
+                return ChunkInfo(index=chunk_index, jsonl_path=jsonl_path, row_count=expected_rows)
 
-        with jsonl_path.open("w", encoding="utf-8") as fh:
+        row_count = 0
+        with jsonl_path.open("wb") as fh:
             for row in rows:
+                row_count += 1
                 lance_db_id = str(row.get("lance_db_id", "")).strip()
                 prompt = self._build_prompt(row)
                 request = {
@@ -1356,75 +2171,41 @@ class SequentialBatchPipeline:
                         "store": True,
                     },
                 }
-                fh.write(json.dumps(request) + "\n")
+                fh.write(_json_dumps_bytes(request))
+                fh.write(b"\n")
 
         metadata = {
-            "row_count": len(rows),
+            "row_count": row_count,
             "source_csv": self.filtered_csv_with_ids.name if self.filtered_csv_with_ids else "",
             "prompt_file": self.prompt_file_name,
             "source_hash": self.file_hash,
         }
         metadata_path.write_text(json.dumps(metadata, indent=2))
 
-        return ChunkInfo(index=chunk_index, jsonl_path=jsonl_path, row_count=len(rows))
+        return ChunkInfo(index=chunk_index, jsonl_path=jsonl_path, row_count=row_count)
 
     def _build_prompt(self, row: Dict[str, str]) -> str:
-        posts_raw = row.get("posts", "") or ""
-        caption_location_pairs: List[str] = []
-        location_summary: List[str] = []
-        if posts_raw:
-            try:
-                posts = json.loads(posts_raw)
-                if isinstance(posts, list):
-                    for post in posts[:CAPTIONS_TO_INSPECT]:
-                        caption = ""
-                        location_name = ""
-                        if isinstance(post, dict):
-                            caption = str(post.get("caption", ""))
-                            raw_location = post.get("location_name")
-                            if not raw_location and isinstance(post.get("location"), dict):
-                                raw_location = post.get("location", {}).get("name")
-                            if isinstance(raw_location, str):
-                                location_name = _decode_text(raw_location).strip()
-                                if location_name and location_name not in location_summary:
-                                    location_summary.append(location_name)
-                        elif isinstance(post, str):
-                            caption = post
-
-                        caption = caption.strip()
-                        if caption:
-                            if location_name:
-                                caption_location_pairs.append(
-                                    f"Post: {caption} (Location: {location_name})"
-                                )
-                            else:
-                                caption_location_pairs.append(
-                                    f"Post: {caption} (Location: Unknown)"
-                                )
-            except json.JSONDecodeError:
-                trimmed = posts_raw[:200]
-                caption_location_pairs.append(f"Post: {trimmed} (Location: Unknown)")
+        if self.prompt_fields is None:
+            return self.prompt_template
 
         context = {
             "account": row.get("account", ""),
             "full_name": row.get("full_name", ""),
             "biography": row.get("biography", ""),
-            "captions": " | ".join(caption_location_pairs),
-            "post_locations": " | ".join(location_summary) if location_summary else "Unknown",
         }
-
-        try:
-            prompt = self.prompt_template.format(**context)
-        except KeyError:
-            prompt = self.prompt_template
-        return prompt
-
+        if not self.prompt_fields.isdisjoint(("captions", "post_locations")):
+            context["captions"], context["post_locations"] = _prompt_post_context(
+                row.get("posts", "") or ""
+            )
+        return self.prompt_template.format_map(context)
 
     # ------------------------------------------------------------------ step 2
     def process_batches(self, chunk_infos: Sequence[ChunkInfo]) -> None:
-        print("\n🚀 Step 2: Submitting batches sequentially and downloading results")
+        print("\n🚀 Step 2: Submitting batches and downloading results")
 
         any_submitted = False
+        to_submit: List[ChunkInfo] = []
+        to_resume: List[Tuple[BatchJobRecord, ChunkInfo, Path, Path]] = []
         for info in chunk_infos:
             chunk_csv = self.batch_results_dir / f"{self.namespace}_batch_{info.index:03d}_chunk.csv"
             results_jsonl = self.batch_results_dir / f"{self.namespace}_batch_{info.index:03d}_results.jsonl"
@@ -1445,36 +2226,91 @@ class SequentialBatchPipeline:
             if existing_job and existing_job.status != "completed":
                 print(f"   ♻️  Resuming batch {info.index:03d} (batch id {existing_job.batch_id})")
                 existing_job.profile_count = existing_job.profile_count or info.row_count
+                to_resume.append((existing_job, info, results_jsonl, chunk_csv))
+                continue
+
+            to_submit.append(info)
+
+        if to_resume:
+            # One polling loop covers every resumed job instead of waiting on each in turn
+            waiting = [job for job, *_ in to_resume if job.batch_id]
+            failures = self._wait_for_all_batches(waiting) if waiting else {}
+            self._record_jobs(waiting)
+            completed_jobs: List[Tuple[BatchJobRecord, ChunkInfo, Path, Path]] = []
+            for job, info, results_jsonl, chunk_csv in to_resume:
                 try:
-                    job = self._resume_job(existing_job, info, results_jsonl, chunk_csv)
+                    if job.batch_id in failures:
+                        raise RuntimeError(failures[job.batch_id])
+                    self._await_job_output(job, info)
                 except RuntimeError as exc:
-                    print(f"      ⚠️ Previous batch failed ({exc}). Submitting a new batch.")
+                    print(f"      ⚠️ Previous batch {info.index:03d} failed ({exc}). Submitting a new batch.")
                     self.job_state.pop(str(info.index), None)
                     self._persist_job_state()
+                    to_submit.append(info)
                 else:
-                    self.jobs.append(job)
-                    continue
+                    completed_jobs.append((job, info, results_jsonl, chunk_csv))
+            self._collect_job_results(completed_jobs)
 
-            jsonl_path = info.jsonl_path
-            print(f"   📤 Uploading batch {info.index:03d} ({info.row_count} profiles)")
-            job = self._upload_and_create_batch(jsonl_path, info.index)
-            job.profile_count = info.row_count
-            job.status = job.status or "submitted"
-            self._record_job(job)
-            self.jobs.append(job)
+        if to_submit:
+            print(
+                f"   📤 Uploading {len(to_submit)} batch file(s) "
+                f"({BATCH_SUBMIT_CONCURRENCY} at a time)"
+            )
+            self.jobs.extend(asyncio.run(self._submit_batches(to_submit)))
             any_submitted = True
-            print(f"      📨 Submitted batch {info.index:03d} (batch id {job.batch_id}, status {job.status})")
 
         self.pending_batch_submissions = any_submitted
         if any_submitted:
             print("\n⏳ All batch jobs have been submitted. Re-run the pipeline later with --resume-from process to wait for completion and download results.")
 
-    def _upload_and_create_batch(self, jsonl_path: Path, chunk_number: int) -> BatchJobRecord:
-        client = self._get_client()
-        with jsonl_path.open("rb") as fh:
-            file_obj = client.files.create(file=fh, purpose="batch")
+    def _collect_job_results(
+        self, completed_jobs: Sequence[Tuple[BatchJobRecord, ChunkInfo, Path, Path]]
+    ) -> None:
+        if not completed_jobs:
+            return
+        workers = min(self.process_workers, len(completed_jobs))
+        with ExitStack() as stack:
+            # Each chunk is downloaded and parsed independently, one per worker
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers)) if workers > 1 else None
+            parse = executor.map if executor is not None else map
+            chunk_csv_paths = parse(
+                _fetch_and_process_results,
+                [info.index for _, info, _, _ in completed_jobs],
+                [job.output_file_id for job, _, _, _ in completed_jobs],
+                [results_jsonl for _, _, results_jsonl, _ in completed_jobs],
+                [chunk_csv for _, _, _, chunk_csv in completed_jobs],
+                [self.prompt_file_name] * len(completed_jobs),
+            )
+            for (job, _, _, _), chunk_csv_path in zip(completed_jobs, chunk_csv_paths):
+                job.result_csv = str(chunk_csv_path)
+                job.status = "completed"
+                self._record_job(job)
+                self.jobs.append(job)
+                print(f"      ✅ Saved parsed results to {self._rel(chunk_csv_path)}")
+
+    async def _submit_batches(self, chunk_infos: Sequence[ChunkInfo]) -> List[BatchJobRecord]:
+        semaphore = asyncio.Semaphore(BATCH_SUBMIT_CONCURRENCY)
+        async with AsyncOpenAI(api_key=_openai_api_key()) as client:
+
+            async def _submit(info: ChunkInfo) -> BatchJobRecord:
+                async with semaphore:
+                    job = await self._upload_and_create_batch_async(client, info.jsonl_path, info.index)
+                job.profile_count = info.row_count
+                job.status = job.status or "submitted"
+                # Recorded as soon as it exists so an interrupted run never re-submits it
+                self._record_job(job)
+                print(f"      📨 Submitted batch {info.index:03d} (batch id {job.batch_id}, status {job.status})")
+                return job
 
-        batch = client.batches.create(
+            return list(await asyncio.gather(*(_submit(info) for info in chunk_infos)))
+
+    async def _upload_and_create_batch_async(
+        self, client: AsyncOpenAI, jsonl_path: Path, chunk_number: int
+    ) -> BatchJobRecord:
+        # A path (rather than an open file) lets the client read it without blocking the loop
+        file_obj = await client.files.create(file=jsonl_path, purpose="batch")
+
+        batch = await client.batches.create(
             input_file_id=file_obj.id,
             endpoint="/v1/responses",
             completion_window="24h",
@@ -1492,225 +2328,88 @@ class SequentialBatchPipeline:
         )
 
     def _wait_for_batch(self, job: BatchJobRecord) -> BatchJobRecord:
-        client = self._get_client()
-        attempts = 0
-        while True:
-            batch = client.batches.retrieve(job.batch_id)
-            job.status = batch.status
-            if batch.request_counts:
-                try:
-                    total = batch.request_counts.total
-                    completed = batch.request_counts.completed
-                    failed = batch.request_counts.failed
-                except AttributeError:
-                    counts = batch.request_counts
-                    total = counts.get("total")
-                    completed = counts.get("completed")
-                    failed = counts.get("failed")
-                print(f"      status={batch.status} total={total} completed={completed} failed={failed}")
-            else:
-                print(f"      status={batch.status}")
-
-            if batch.status == "completed":
-                job.completed_at = time.time()
-                job.output_file_id = batch.output_file_id
-                print("      ✅ Batch completed")
-                return job
+        failures = self._wait_for_all_batches([job])
+        if job.batch_id in failures:
+            raise RuntimeError(failures[job.batch_id])
+        return job
 
-            if batch.status in {"failed", "expired", "cancelled"}:
-                raise RuntimeError(f"Batch {job.batch_id} ended with status {batch.status}")
+    def _wait_for_all_batches(self, jobs: Sequence[BatchJobRecord]) -> Dict[str, str]:
+        """Poll ``jobs`` until each is terminal and return failure reasons by batch id.
 
+        Each cycle lists recent batches in one request and only retrieves jobs
+        missing from that page. The wait between cycles backs off from 30s up
+        to the configured poll interval, with jitter, and never sleeps past the
+        earliest ``expires_at`` of a pending batch.
+        """
+        client = self._get_client()
+        pending = {job.batch_id: job for job in jobs}
+        failures: Dict[str, str] = {}
+        attempts = 0
+        wait_for = float(MIN_POLL_SECONDS)
+        max_wait = max(self.poll_interval, MIN_POLL_SECONDS)
+        while pending:
+            listed = {batch.id: batch for batch in client.batches.list(limit=100).data}
+            expires_at: Optional[float] = None
+            for batch_id, job in list(pending.items()):
+                batch = listed.get(batch_id) or client.batches.retrieve(batch_id)
+                job.status = batch.status
+                label = f"batch {job.chunk_number:03d}"
+                if batch.request_counts:
+                    try:
+                        total = batch.request_counts.total
+                        completed = batch.request_counts.completed
+                        failed = batch.request_counts.failed
+                    except AttributeError:
+                        counts = batch.request_counts
+                        total = counts.get("total")
+                        completed = counts.get("completed")
+                        failed = counts.get("failed")
+                    print(f"      {label} status={batch.status} total={total} completed={completed} failed={failed}")
+                else:
+                    print(f"      {label} status={batch.status}")
+
+                if batch.status == "completed":
+                    job.completed_at = time.time()
+                    job.output_file_id = batch.output_file_id
+                    print(f"      ✅ Batch {job.chunk_number:03d} completed")
+                    del pending[batch_id]
+                elif batch.status in {"failed", "expired", "cancelled"}:
+                    failures[batch_id] = f"Batch {batch_id} ended with status {batch.status}"
+                    del pending[batch_id]
+                elif getattr(batch, "expires_at", None):
+                    expires_at = min(expires_at or batch.expires_at, batch.expires_at)
+
+            if not pending:
+                break
             attempts += 1
             if attempts >= self.max_attempts:
-                raise RuntimeError("Maximum polling attempts exceeded")
+                for batch_id in pending:
+                    failures[batch_id] = "Maximum polling attempts exceeded"
+                break
 
-            wait_for = max(self.poll_interval, 30)
-            print(f"      ⏳ Waiting {wait_for}s...")
-            time.sleep(wait_for)
+            sleep_for = wait_for * (1 + random.uniform(0, POLL_JITTER_FRACTION))
+            if expires_at is not None:
+                sleep_for = max(min(sleep_for, expires_at - time.time()), MIN_POLL_SECONDS)
+            print(f"      ⏳ Waiting {sleep_for:.0f}s for {len(pending)} batch(es)...")
+            time.sleep(sleep_for)
+            wait_for = min(wait_for * POLL_BACKOFF_FACTOR, max_wait)
+        return failures
 
-    def _download_results(self, job: BatchJobRecord, target_path: Path) -> None:
-        if not job.output_file_id:
-            raise RuntimeError("No output file id available for download")
-        client = self._get_client()
-        response = client.files.content(job.output_file_id)
-        content = getattr(response, "text", None)
-        if content is None:
-            content = response.read().decode("utf-8")  # type: ignore[attr-defined]
-        with target_path.open("w", encoding="utf-8") as fh:
-            fh.write(content)
-        print(f"      💾 Results downloaded to {self._rel(target_path)}")
-
-    def _resume_job(
-        self,
-        job: BatchJobRecord,
-        info: ChunkInfo,
-        results_jsonl: Path,
-        chunk_csv: Path,
-    ) -> BatchJobRecord:
+    def _await_job_output(self, job: BatchJobRecord, info: ChunkInfo) -> None:
         if not job.batch_id:
             raise RuntimeError("Missing batch identifier for resume")
 
         job.profile_count = job.profile_count or info.row_count
 
-        try:
-            job = self._wait_for_batch(job)
-        finally:
-            self._record_job(job)
+        if job.status != "completed" or not job.output_file_id:
+            try:
+                job = self._wait_for_batch(job)
+            finally:
+                self._record_job(job)
 
         if not job.output_file_id:
             raise RuntimeError("Batch completed without output file id")
 
-        if not results_jsonl.exists():
-            self._download_results(job, results_jsonl)
-
-        chunk_csv_path = self._process_results(info.index, results_jsonl, chunk_csv)
-        job.result_csv = str(chunk_csv_path)
-        job.status = "completed"
-        self._record_job(job)
-        print(f"      ✅ Saved parsed results to {self._rel(chunk_csv_path)}")
-        return job
-
-    def _process_results(self, chunk_index: int, results_path: Path, csv_target: Path) -> Path:
-        output_rows: List[Dict[str, Optional[str]]] = []
-        with results_path.open("r", encoding="utf-8") as fh:
-            for line_num, line in enumerate(fh, start=1):
-                if not line.strip():
-                    continue
-                try:
-                    payload = json.loads(line)
-                except json.JSONDecodeError:
-                    output_rows.append(
-                        {
-                            "lance_db_id": "",
-                            "raw_response": line.strip(),
-                            "processing_error": f"json_decode_error_line_{line_num}",
-                            "source_batch": f"batch_{chunk_index:03d}",
-                            "prompt_file": self.prompt_file_name,
-                        }
-                    )
-                    continue
-
-                custom_id = payload.get("custom_id", "")
-                lance_db_id = custom_id.replace("profile-", "") if custom_id.startswith("profile-") else ""
-
-                parsed: Dict[str, Optional[str]] = {
-                    "lance_db_id": lance_db_id,
-                    "raw_response": "",
-                    "processing_error": "",
-                    "source_batch": f"batch_{chunk_index:03d}",
-                    "prompt_file": self.prompt_file_name,
-                }
-
-                if payload.get("response") and payload["response"].get("status_code") == 200:
-                    response_body = payload["response"].get("body", {})
-                    text_content = ""
-                    for output in response_body.get("output", []):
-                        if output.get("type") == "message":
-                            for part in output.get("content", []):
-                                if part.get("type") == "output_text":
-                                    text_content = part.get("text", "")
-                                    break
-                    parsed.update(self._parse_response_text(text_content))
-                    parsed["raw_response"] = text_content
-                else:
-                    error = payload.get("error") or payload.get("response", {}).get("status_code")
-                    parsed["processing_error"] = f"api_error:{error}"
-                    parsed["raw_response"] = json.dumps(payload)[:500]
-
-                output_rows.append(parsed)
-
-        with csv_target.open("w", encoding="utf-8", newline="") as out_fh:
-            writer = csv.DictWriter(out_fh, fieldnames=CSV_FIELD_ORDER)
-            writer.writeheader()
-            for row in output_rows:
-                writer.writerow({key: row.get(key, "") for key in CSV_FIELD_ORDER})
-        return csv_target
-
-    def _parse_response_text(self, text: str) -> Dict[str, Optional[str]]:
-        if not text:
-            return {
-                "individual_vs_org": None,
-                "generational_appeal": None,
-                "professionalization": None,
-                "relationship_status": None,
-                "location": "",
-                "ethnicity": "",
-                "age": "",
-                "occupation": "",
-                **{f"keyword{i}": "" for i in range(1, 11)},
-                "processing_error": "empty_response",
-            }
-
-        candidate_line = None
-        for line in text.strip().splitlines():
-            if "," in line:
-                candidate_line = line.strip()
-                break
-        if candidate_line is None:
-            candidate_line = text.strip()
-
-        reader = csv.reader([candidate_line])
-        try:
-            values = next(reader)
-        except Exception:
-            return {
-                "individual_vs_org": None,
-                "generational_appeal": None,
-                "professionalization": None,
-                "relationship_status": None,
-                "location": "",
-                "ethnicity": "",
-                "age": "",
-                **{f"keyword{i}": "" for i in range(1, 11)},
-                "processing_error": "csv_parse_error",
-            }
-
-        if len(values) < 18:
-            return {
-                "individual_vs_org": None,
-                "generational_appeal": None,
-                "professionalization": None,
-                "relationship_status": None,
-                "location": "",
-                "ethnicity": "",
-                "age": "",
-                "occupation": "",
-                **{f"keyword{i}": "" for i in range(1, 11)},
-                "processing_error": f"unexpected_value_count:{len(values)}",
-            }
-
-        def parse_score(raw: str) -> Optional[int]:
-            raw = raw.strip()
-            if not raw:
-                return None
-            try:
-                val = int(round(float(raw)))
-                return max(0, min(10, val))
-            except ValueError:
-                return None
-
-        scores = [parse_score(values[i]) for i in range(4)]
-        location = values[4].strip() or ""
-        ethnicity = values[5].strip() or ""
-        age = values[6].strip() or ""
-        occupation = values[7].strip() or ""
-        keywords = [v.strip() for v in values[8:18]]
-
-        result = {
-            "individual_vs_org": scores[0],
-            "generational_appeal": scores[1],
-            "professionalization": scores[2],
-            "relationship_status": scores[3],
-            "location": location,
-            "ethnicity": ethnicity,
-            "age": age,
-            "occupation": occupation,
-            "processing_error": "" if all(score is not None for score in scores) else "missing_scores",
-        }
-        for idx in range(10):
-            result[f"keyword{idx + 1}"] = keywords[idx] if idx < len(keywords) else ""
-        return result
-
     # ------------------------------------------------------------------ public
     def run(self) -> None:
         print(f"📁 Dataset directory: {self.dataset_dir}")
@@ -1721,7 +2420,7 @@ class SequentialBatchPipeline:
         if not self.force and not self.test_mode and self._already_processed():
             return
 
-        if STEP_ORDER[self.resume_from] <= STEP_ORDER[STEP_LANGUAGE]:
+        if self._resume_order <= STEP_ORDER[STEP_LANGUAGE]:
             filtered_csv = self.perform_language_filter()
         else:
             print("⏭️  Resuming from existing language-filter outputs")
@@ -1754,9 +2453,17 @@ class SequentialBatchPipeline:
         print("\n🎉 Language filtering and batch processing completed")
 
     def _should_stop(self, step: str) -> bool:
-        if self.stop_after is None:
-            return False
-        return STEP_ORDER[step] >= STEP_ORDER[self.stop_after]
+        return self._stop_order is not None and STEP_ORDER[step] >= self._stop_order
+
+
+def _iter_csv_files(root: Path) -> Iterator[Path]:
+    """Yield every ``*.csv`` file under ``root`` using scandir's cached entry types."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_csv_files(Path(entry.path))
+            elif entry.name.endswith(".csv") and entry.is_file():
+                yield Path(entry.path)
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -1780,10 +2487,17 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=DEFAULT_CSV_WORKERS,
         help=(
             "Maximum number of CSV files to process in parallel when the input "
-            "path is a directory (default: matches local CPU count)."
+            "path is a directory, and worker processes used by --combine-platforms "
+            "and by Step 0 normalization / Step 2 result parsing of a single CSV "
+            "(default: matches local CPU count)."
         ),
     )
-    parser.add_argument("--poll-interval", type=int, default=300, help="Seconds between status checks (default: 300)")
+    parser.add_argument(
+        "--poll-interval",
+        type=int,
+        default=300,
+        help="Longest wait in seconds between status checks; polling backs off from 30s (default: 300)",
+    )
     parser.add_argument("--max-attempts", type=int, default=1000, help="Maximum polling iterations (default: 1000)")
     parser.add_argument(
         "--stop-after",
@@ -1803,6 +2517,17 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=DEFAULT_MIN_TEXT_CHARS,
         help="Minimum characters required before language detection applies (default: 60)",
     )
+    parser.add_argument(
+        "--language-backend",
+        choices=LANGUAGE_BACKENDS,
+        default="lingua",
+        help="Language detector used by Step 0 (default: lingua)",
+    )
+    parser.add_argument(
+        "--fasttext-model",
+        default=DEFAULT_FASTTEXT_MODEL,
+        help=f"Path to the FastText lid.176 model for --language-backend fasttext (default: {DEFAULT_FASTTEXT_MODEL})",
+    )
     parser.add_argument(
         "--prompt-file",
         default="prompts/current_prompt.txt",
@@ -1821,6 +2546,28 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _run_pipeline_for_csv(csv_path: Path, options: PipelineOptions, namespace: Optional[str]) -> None:
+    pipeline = SequentialBatchPipeline(
+        csv_path=csv_path,
+        chunk_size=options.chunk_size,
+        language_batch_size=options.language_batch_size,
+        poll_interval=options.poll_interval,
+        max_attempts=options.max_attempts,
+        stop_after=options.stop_after,
+        resume_from=options.resume_from,
+        test_mode=options.test_mode,
+        min_text_chars=options.min_text_chars,
+        prompt_file=options.prompt_file,
+        force=options.force,
+        dataset_namespace=namespace,
+        process_workers=options.process_workers,
+        language_backend=options.language_backend,
+        fasttext_model=options.fasttext_model,
+    )
+    print(f"\n▶️  Executing pipeline for {csv_path.name}...")
+    pipeline.run()
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     args = parse_args(argv)
     print("\n🚀 Starting pipeline_batch_process")
@@ -1834,6 +2581,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         f"   • stop_after={args.stop_after or 'auto'}\n"
         f"   • test_mode={'on' if args.test else 'off'}\n"
         f"   • min_text_chars={args.min_text_chars}\n"
+        f"   • language_backend={args.language_backend}\n"
         f"   • force={'on' if args.force else 'off'}\n"
         f"   • combine_platforms={'on' if args.combine_platforms else 'off'}"
     )
@@ -1849,7 +2597,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             )
             return 1
         try:
-            combined_path = combine_platform_datasets(csv_input)
+            combined_path = combine_platform_datasets(csv_input, workers=max(1, args.csv_workers))
         except Exception as exc:
             print(f"❌ Failed to combine platform datasets: {exc}")
             return 1
@@ -1862,11 +2610,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             return 1
         if csv_input.is_dir():
             base_dir = csv_input.resolve()
-            input_csvs = sorted(
-                path.resolve()
-                for path in base_dir.rglob("*.csv")
-                if path.is_file()
-            )
+            input_csvs = sorted(path.resolve() for path in _iter_csv_files(base_dir))
             if not input_csvs:
                 print(f"❌ No CSV files found under directory: {csv_input}")
                 return 1
@@ -1885,6 +2629,11 @@ def main(argv: Optional[List[str]] = None) -> int:
         candidate = Path(__file__).resolve().parent / prompt_path
         if candidate.exists():
             prompt_path = candidate
+    fasttext_model_path = Path(args.fasttext_model)
+    if not fasttext_model_path.is_absolute():
+        candidate = Path(__file__).resolve().parent / fasttext_model_path
+        if candidate.exists():
+            fasttext_model_path = candidate
 
     if len(input_csvs) == 1:
         print(f"   📂 Resolved CSV path: {input_csvs[0]}")
@@ -1910,42 +2659,50 @@ def main(argv: Optional[List[str]] = None) -> int:
         relative_str = str(relative).replace(os.sep, "_")
         return SequentialBatchPipeline._make_namespace(relative_str)
 
-    def _run_pipeline_for_csv(csv_path: Path) -> None:
-        namespace = _derive_namespace(csv_path)
-        pipeline = SequentialBatchPipeline(
-            csv_path=csv_path,
-            chunk_size=args.chunk_size,
-            language_batch_size=args.language_batch_size,
-            poll_interval=args.poll_interval,
-            max_attempts=args.max_attempts,
-            stop_after=target_stop,
-            resume_from=target_resume,
-            test_mode=args.test,
-            min_text_chars=args.min_text_chars,
-            prompt_file=prompt_path,
-            force=args.force,
-            dataset_namespace=namespace,
-        )
-        print(f"\n▶️  Executing pipeline for {csv_path.name}...")
-        pipeline.run()
+    options = PipelineOptions(
+        chunk_size=args.chunk_size,
+        language_batch_size=args.language_batch_size,
+        poll_interval=args.poll_interval,
+        max_attempts=args.max_attempts,
+        stop_after=target_stop,
+        resume_from=target_resume,
+        test_mode=args.test,
+        min_text_chars=args.min_text_chars,
+        prompt_file=prompt_path,
+        force=args.force,
+        # A directory run already fans CSVs out across threads
+        process_workers=max(1, args.csv_workers) if len(input_csvs) == 1 else 1,
+        language_backend=args.language_backend,
+        fasttext_model=fasttext_model_path,
+    )
 
     try:
         if len(input_csvs) > 1:
             errors: List[Tuple[Path, Exception]] = []
             max_workers = max(1, args.csv_workers)
+            remaining = iter(input_csvs)
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_map = {executor.submit(_run_pipeline_for_csv, path): path for path in input_csvs}
-                for future in as_completed(future_map):
-                    csv_path = future_map[future]
-                    try:
-                        future.result()
-                    except Exception as exc:
-                        print(f"\n❌ Pipeline failed for {csv_path}: {exc}")
-                        errors.append((csv_path, exc))
+                # Submit-on-drain: only max_workers pipelines are ever queued or running
+                pending: Dict[Future, Path] = {}
+                while True:
+                    for csv_path in islice(remaining, max_workers - len(pending)):
+                        pending[
+                            executor.submit(_run_pipeline_for_csv, csv_path, options, _derive_namespace(csv_path))
+                        ] = csv_path
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        csv_path = pending.pop(future)
+                        try:
+                            future.result()
+                        except Exception as exc:
+                            print(f"\n❌ Pipeline failed for {csv_path}: {exc}")
+                            errors.append((csv_path, exc))
             if errors:
                 return 1
         else:
-            _run_pipeline_for_csv(input_csvs[0])
+            _run_pipeline_for_csv(input_csvs[0], options, _derive_namespace(input_csvs[0]))
     except KeyboardInterrupt:
         print("\n⏹️  Pipeline interrupted by user. Re-run the same command to resume.")
         return 130
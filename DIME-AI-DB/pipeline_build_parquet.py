@@ -10,14 +10,21 @@ path, a combined dataset is produced in the configured combined subdirectory.
 from __future__ import annotations
 
 import argparse
-import json
+import csv
+import io
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from pandas.api.types import union_categoricals
 
 try:
     from tqdm import tqdm
@@ -30,17 +37,33 @@ from pipeline_batch_process import (
     COMBINED_HEADERS,
     COMBINED_SUBDIR,
     _compute_post_statistics,
-    _count_instagram_media,
+    _json_loads,
     _merge_tiktok_posts,
+    _normalize_and_stat,
     _normalize_posts,
 )
 from src.data.dataset_builder import UnifiedDataLoader
 
 SCRIPT_ROOT = Path(__file__).resolve().parent
+_SCRIPT_ROOT_STR = str(SCRIPT_ROOT)
+_SCRIPT_ROOT_PREFIX = os.path.join(_SCRIPT_ROOT_STR, "")
 PIPELINE_DIR = SCRIPT_ROOT / "pipeline"
 LANGUAGE_FILTER_DIR = PIPELINE_DIR / "step0_language_filter"
 LLM_RESULTS_DIR = PIPELINE_DIR / "step2_batch_results"
 
+# Parquet layout: zstd pages and bounded row groups so readers can skip groups
+PARQUET_ROW_GROUP_SIZE = 131_072
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+
+# Low-cardinality columns held as pandas categoricals between merge and export
+CATEGORICAL_COLUMNS = ("platform", "is_verified", "is_private", "is_commerce_user", "source_csv")
+
+# Frames smaller than this normalize posts in-process; a pool costs more to start
+PARALLEL_POSTS_MIN_ROWS = 5000
+# Rows handed to each posts-normalization worker task
+POSTS_MAP_CHUNKSIZE = 512
+
 NORMALIZED_PROFILE_COLUMNS = COMBINED_HEADERS + [
     "individual_vs_org_score",
     "generational_appeal_score",
@@ -78,13 +101,6 @@ class CSVContext:
     stage0_csv: Optional[Path]
 
 
-def _first_non_empty(*values: Optional[str]) -> str:
-    for value in values:
-        if isinstance(value, str) and value.strip():
-            return value.strip()
-    return ""
-
-
 def _normalize_flag(value: object) -> str:
     if isinstance(value, bool):
         return "true" if value else "false"
@@ -105,124 +121,143 @@ def _to_string(value: object) -> str:
     return str(value)
 
 
-def _normalize_id(value: object) -> str:
-    if value is None or (isinstance(value, float) and pd.isna(value)):
-        return ""
-    return str(value).strip()
+_TRUE_FLAGS = frozenset({"true", "1", "yes", "y"})
+_FALSE_FLAGS = frozenset({"false", "0", "no", "n"})
 
 
-def _normalize_tiktok_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    length = len(df)
+def _string_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Vectorized ``df[column].apply(_to_string)``; a missing column is all ""."""
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    series = df[column]
+    return series.astype(str).where(series.notna(), "")
 
-    df["platform"] = "tiktok"
-    df["platform_id"] = df.get("id", pd.Series([""] * length)).apply(_to_string)
-    df["username"] = df.get("account_id", pd.Series([""] * length)).apply(_to_string)
-    df["display_name"] = df.apply(
-        lambda row: _first_non_empty(
-            _to_string(row.get("profile_name")),
-            _to_string(row.get("nickname")),
-            _to_string(row.get("account_id")),
-        ),
-        axis=1,
-    )
 
-    df["likes_total"] = df.get("likes", pd.Series([""] * length)).apply(_to_string)
-    df["engagement_rate"] = df.get("awg_engagement_rate", pd.Series([""] * length)).apply(
-        _to_string
-    )
-    df["posts_count"] = df.get("videos_count", pd.Series([""] * length)).apply(
-        _to_string
-    )
-    df["external_url"] = df.get("bio_link", pd.Series([""] * length)).apply(_to_string)
-    df["profile_url"] = df.get("url", pd.Series([""] * length)).apply(_to_string)
-    df["profile_image_url"] = df.apply(
-        lambda row: _first_non_empty(
-            _to_string(row.get("profile_pic_url_hd")),
-            _to_string(row.get("profile_pic_url")),
+def _first_non_empty_column(df: pd.DataFrame, *columns: str) -> pd.Series:
+    """Vectorized row-wise ``_first_non_empty`` over the given columns."""
+    result = _string_column(df, columns[0]).str.strip()
+    for column in columns[1:]:
+        blank = result == ""
+        if not blank.any():
+            break
+        result = result.where(~blank, _string_column(df, column).str.strip())
+    return result
+
+
+def _flag_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Vectorized ``df[column].apply(_normalize_flag)``; a missing column is all ""."""
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    series = df[column]
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        # Plain truthiness, so NaN counts as true exactly like _normalize_flag
+        return pd.Series(
+            np.where(series.to_numpy() != 0, "true", "false"), index=df.index, dtype=object
+        )
+    try:
+        lowered = series.str.strip().str.lower()
+    except AttributeError:
+        return series.apply(_normalize_flag)
+    result = pd.Series(
+        np.select(
+            [lowered.isin(_TRUE_FLAGS), lowered.isin(_FALSE_FLAGS)], ["true", "false"], ""
         ),
-        axis=1,
-    )
-    df["is_verified"] = df.get("is_verified", pd.Series([""] * length)).apply(
-        _normalize_flag
-    )
-    df["is_private"] = df.get("is_private", pd.Series([""] * length)).apply(
-        _normalize_flag
-    )
-    df["is_commerce_user"] = df.get("is_commerce_user", pd.Series([""] * length)).apply(
-        _normalize_flag
+        index=df.index,
+        dtype=object,
     )
+    # Non-string cells (missing values, numbers, bools) keep the scalar rules
+    non_string = lowered.isna()
+    if non_string.any():
+        result[non_string] = series[non_string].apply(_normalize_flag)
+    return result
+
+
+def _tiktok_posts_row(videos: Any, posts: Any) -> Tuple[str, str, str, str, str]:
+    """Return ``(posts_json, reel_ratio, median_view, median_like, median_comment)``."""
+    merged_posts = _merge_tiktok_posts({"top_videos": videos, "top_posts_data": posts})
+    normalized_posts = _normalize_posts(merged_posts, "tiktok")
+    return (normalized_posts, *_compute_post_statistics(normalized_posts))
+
+
+def _instagram_posts_row(raw_posts: Any) -> Tuple[str, str, str, str, str, str, str]:
+    """Return the TikTok row fields plus ``(total_images, total_reels)``."""
+    return _normalize_and_stat(raw_posts, "instagram")
+
+
+def _map_posts_rows(
+    func: Callable[..., Tuple[str, ...]],
+    columns: Sequence[List[Any]],
+    width: int,
+    workers: int,
+) -> List[List[str]]:
+    """Apply ``func`` across the row values and return its results column-wise."""
+    if workers > 1 and len(columns[0]) >= PARALLEL_POSTS_MIN_ROWS:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(func, *columns, chunksize=POSTS_MAP_CHUNKSIZE))
+    else:
+        rows = list(map(func, *columns))
+    if not rows:
+        return [[] for _ in range(width)]
+    return [list(column) for column in zip(*rows)]
+
 
-    posts_json: List[str] = []
-    reel_ratio: List[str] = []
-    median_view: List[str] = []
-    median_like: List[str] = []
-    median_comment: List[str] = []
-
-    for row in df.to_dict("records"):
-        merged_posts = _merge_tiktok_posts(row)
-        normalized_posts = _normalize_posts(merged_posts, "tiktok")
-        stats = _compute_post_statistics(normalized_posts)
-        posts_json.append(normalized_posts)
-        reel_ratio.append(stats[0])
-        median_view.append(stats[1])
-        median_like.append(stats[2])
-        median_comment.append(stats[3])
+def _normalize_tiktok_dataframe(df: pd.DataFrame, workers: int = 1) -> pd.DataFrame:
+    # Shallow copy: every column below is assigned whole, never written in place,
+    # so the caller's frame stays untouched without duplicating the raw columns
+    df = df.copy(deep=False)
+    length = len(df)
+
+    df["platform"] = "tiktok"
+    df["platform_id"] = _string_column(df, "id")
+    df["username"] = _string_column(df, "account_id")
+    df["display_name"] = _first_non_empty_column(df, "profile_name", "nickname", "account_id")
+
+    df["likes_total"] = _string_column(df, "likes")
+    df["engagement_rate"] = _string_column(df, "awg_engagement_rate")
+    df["posts_count"] = _string_column(df, "videos_count")
+    df["external_url"] = _string_column(df, "bio_link")
+    df["profile_url"] = _string_column(df, "url")
+    df["profile_image_url"] = _first_non_empty_column(df, "profile_pic_url_hd", "profile_pic_url")
+    df["is_verified"] = _flag_column(df, "is_verified")
+    df["is_private"] = _flag_column(df, "is_private")
+    df["is_commerce_user"] = _flag_column(df, "is_commerce_user")
+
+    # _merge_tiktok_posts only reads these two columns; a missing one reads as None
+    top_videos = df["top_videos"].tolist() if "top_videos" in df.columns else [None] * length
+    top_posts = df["top_posts_data"].tolist() if "top_posts_data" in df.columns else [None] * length
+    posts_json, reel_ratio, median_view, median_like, median_comment = _map_posts_rows(
+        _tiktok_posts_row, (top_videos, top_posts), 5, workers
+    )
 
     df["posts"] = posts_json
     df["reel_post_ratio_last10"] = reel_ratio
     df["median_view_count_last10"] = median_view
     df["median_like_count_last10"] = median_like
     df["median_comment_count_last10"] = median_comment
-    df["total_img_posts_ig"] = [""] * length
-    df["total_reels_ig"] = [""] * length
+    df["total_img_posts_ig"] = ""
+    df["total_reels_ig"] = ""
 
     return df
 
 
-def _normalize_instagram_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+def _normalize_instagram_dataframe(df: pd.DataFrame, workers: int = 1) -> pd.DataFrame:
+    # Shallow copy: every column below is assigned whole, never written in place,
+    # so the caller's frame stays untouched without duplicating the raw columns
+    df = df.copy(deep=False)
     length = len(df)
 
     df["platform"] = "instagram"
-    df["platform_id"] = df.apply(
-        lambda row: _first_non_empty(
-            _to_string(row.get("fbid")),
-            _to_string(row.get("id")),
-        ),
-        axis=1,
-    )
-    df["username"] = df.get("account", pd.Series([""] * length)).apply(_to_string)
-    df["display_name"] = df.apply(
-        lambda row: _first_non_empty(
-            _to_string(row.get("profile_name")),
-            _to_string(row.get("full_name")),
-            _to_string(row.get("account")),
-        ),
-        axis=1,
-    )
-    df["likes_total"] = df.get("likes_total", pd.Series([""] * length)).apply(
-        _to_string
-    )
-    df["engagement_rate"] = df.get("avg_engagement", pd.Series([""] * length)).apply(
-        _to_string
-    )
-    df["posts_count"] = df.get("posts_count", pd.Series([""] * length)).apply(
-        _to_string
-    )
-    df["profile_url"] = df.get("profile_url", pd.Series([""] * length)).apply(
-        _to_string
-    )
-    df["profile_image_url"] = df.get(
-        "profile_image_link", pd.Series([""] * length)
-    ).apply(_to_string)
-    df["is_verified"] = df.get("is_verified", pd.Series([""] * length)).apply(
-        _normalize_flag
-    )
-    df["is_private"] = df.get("is_private", pd.Series([""] * length)).apply(
-        _normalize_flag
-    )
-    df["is_commerce_user"] = ["false"] * length
+    df["platform_id"] = _first_non_empty_column(df, "fbid", "id")
+    df["username"] = _string_column(df, "account")
+    df["display_name"] = _first_non_empty_column(df, "profile_name", "full_name", "account")
+    df["likes_total"] = _string_column(df, "likes_total")
+    df["engagement_rate"] = _string_column(df, "avg_engagement")
+    df["posts_count"] = _string_column(df, "posts_count")
+    df["profile_url"] = _string_column(df, "profile_url")
+    df["profile_image_url"] = _string_column(df, "profile_image_link")
+    df["is_verified"] = _flag_column(df, "is_verified")
+    df["is_private"] = _flag_column(df, "is_private")
+    df["is_commerce_user"] = "false"
 
     def _normalize_external(value: object) -> str:
         text = _to_string(value)
@@ -230,42 +265,25 @@ def _normalize_instagram_dataframe(df: pd.DataFrame) -> pd.DataFrame:
             return ""
         if text.strip().startswith("["):
             try:
-                parsed = json.loads(text)
+                parsed = _json_loads(text)
                 if isinstance(parsed, list) and parsed:
                     return _to_string(parsed[0])
             except Exception:
                 return text
         return text
 
-    df["external_url"] = df.get("external_url", pd.Series([""] * length)).apply(
-        _normalize_external
-    )
+    df["external_url"] = _string_column(df, "external_url").apply(_normalize_external)
 
-    posts_json: List[str] = []
-    reel_ratio: List[str] = []
-    median_view: List[str] = []
-    median_like: List[str] = []
-    median_comment: List[str] = []
-    total_images: List[str] = []
-    total_reels: List[str] = []
-
-    for row in df.to_dict("records"):
-        raw_posts = row.get("posts", "")
-        normalized_posts = _normalize_posts(raw_posts, "instagram")
-        stats = _compute_post_statistics(normalized_posts)
-        posts_json.append(normalized_posts)
-        reel_ratio.append(stats[0])
-        median_view.append(stats[1])
-        median_like.append(stats[2])
-        median_comment.append(stats[3])
-
-        try:
-            decoded_posts = json.loads(normalized_posts) if normalized_posts else []
-        except json.JSONDecodeError:
-            decoded_posts = []
-        img_count, reel_count = _count_instagram_media(decoded_posts)
-        total_images.append(img_count)
-        total_reels.append(reel_count)
+    raw_posts_column = df["posts"].tolist() if "posts" in df.columns else [""] * length
+    (
+        posts_json,
+        reel_ratio,
+        median_view,
+        median_like,
+        median_comment,
+        total_images,
+        total_reels,
+    ) = _map_posts_rows(_instagram_posts_row, (raw_posts_column,), 7, workers)
 
     df["posts"] = posts_json
     df["reel_post_ratio_last10"] = reel_ratio
@@ -278,15 +296,49 @@ def _normalize_instagram_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def normalize_dataset_records(dataset_name: str, df: pd.DataFrame) -> pd.DataFrame:
+def normalize_dataset_records(dataset_name: str, df: pd.DataFrame, workers: int = 1) -> pd.DataFrame:
     dataset = dataset_name.lower()
     if dataset == "tiktok":
-        return _normalize_tiktok_dataframe(df)
+        return _normalize_tiktok_dataframe(df, workers)
     if dataset == "instagram":
-        return _normalize_instagram_dataframe(df)
+        return _normalize_instagram_dataframe(df, workers)
     return df
 
 
+def _categorize_columns(df: pd.DataFrame) -> None:
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+
+
+def _concat_frames(frames: List[pd.DataFrame], **kwargs: Any) -> pd.DataFrame:
+    """``pd.concat`` that keeps ``CATEGORICAL_COLUMNS`` categorical.
+
+    Concatenating categoricals with different categories silently yields
+    object columns, so every frame is first given the union of categories.
+    """
+    for column in CATEGORICAL_COLUMNS:
+        parts = [frame[column] for frame in frames if column in frame.columns]
+        if not parts or not all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            continue
+        try:
+            categories = union_categoricals(parts, ignore_order=True).categories
+        except TypeError:
+            continue
+        for frame in frames:
+            if column in frame.columns:
+                frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, **kwargs)
+
+
+def _csv_file_names(directory: Path) -> List[str]:
+    """Sorted names of the ``*.csv`` files in ``directory`` from a single scandir."""
+    with os.scandir(directory) as entries:
+        return sorted(
+            entry.name for entry in entries if entry.name.endswith(".csv") and entry.is_file()
+        )
+
+
 def gather_csv_paths(dataset_dir: Path, csv_argument: Optional[str]) -> List[Path]:
     dataset_dir = dataset_dir.resolve()
 
@@ -311,16 +363,16 @@ def gather_csv_paths(dataset_dir: Path, csv_argument: Optional[str]) -> List[Pat
             raise ValueError(f"CSV argument must be a .csv file: {candidate}")
         return [candidate]
 
+    # One directory read; "*with_lance_id*.csv" files come first, then the rest
+    csv_names = _csv_file_names(dataset_dir)
+    with_lance_id = [name for name in csv_names if "with_lance_id" in name[:-4]]
     candidates: List[Path] = []
     seen: set[Path] = set()
-    for pattern in ("*with_lance_id*.csv", "*.csv"):
-        for path in sorted(dataset_dir.glob(pattern)):
-            if not path.is_file():
-                continue
-            resolved = path.resolve()
-            if resolved not in seen:
-                candidates.append(resolved)
-                seen.add(resolved)
+    for name in with_lance_id + csv_names:
+        resolved = (dataset_dir / name).resolve()
+        if resolved not in seen:
+            candidates.append(resolved)
+            seen.add(resolved)
 
     if not candidates:
         raise FileNotFoundError(f"No CSV files found in {dataset_dir}. Provide one with --csv.")
@@ -329,30 +381,34 @@ def gather_csv_paths(dataset_dir: Path, csv_argument: Optional[str]) -> List[Pat
 
 
 def iter_dataset_dirs(root: Path) -> Iterable[Path]:
-    csvs = list(root.glob("*.csv"))
-    if csvs:
+    if _csv_file_names(root):
         yield root.resolve()
         return
 
-    for child in sorted(root.iterdir()):
-        if not child.is_dir():
-            continue
-        if any(child.glob("*.csv")):
-            yield child.resolve()
+    with os.scandir(root) as entries:
+        child_dirs = sorted(entry.name for entry in entries if entry.is_dir())
+    for name in child_dirs:
+        if _csv_file_names(root / name):
+            yield (root / name).resolve()
+
+
+@lru_cache(maxsize=None)
+def _resolved_dir(path: Path) -> Path:
+    return path.resolve()
 
 
 def build_csv_context(dataset_dir: Path, csv_path: Path) -> CSVContext:
-    csv_path = csv_path.resolve()
+    # gather_csv_paths only yields resolved CSV paths
     namespace = f"{dataset_dir.name}_{csv_path.stem}_csv"
     stage0_candidate = LANGUAGE_FILTER_DIR / f"{namespace}_english_profiles_with_lance_id.csv"
-    effective_csv = stage0_candidate if stage0_candidate.exists() else csv_path
+    stage0_csv = stage0_candidate if stage0_candidate.exists() else None
 
     return CSVContext(
-        dataset_dir=dataset_dir.resolve(),
+        dataset_dir=_resolved_dir(dataset_dir),
         requested_csv=csv_path,
-        effective_csv=effective_csv,
+        effective_csv=stage0_csv or csv_path,
         namespace=namespace,
-        stage0_csv=stage0_candidate if stage0_candidate.exists() else None,
+        stage0_csv=stage0_csv,
     )
 
 
@@ -365,12 +421,6 @@ def create_loader(csv_context: CSVContext) -> UnifiedDataLoader:
 
 
 def print_csv_overview(csv_context: CSVContext) -> None:
-    def describe_path(path: Path) -> str:
-        try:
-            return str(path.relative_to(SCRIPT_ROOT))
-        except ValueError:
-            return str(path)
-
     print(f"Dataset directory : {describe_path(csv_context.dataset_dir)}")
     print(f"Requested CSV     : {describe_path(csv_context.requested_csv)}")
     if csv_context.stage0_csv is not None:
@@ -382,45 +432,74 @@ def print_csv_overview(csv_context: CSVContext) -> None:
         print(f"Loading CSV       : {describe_path(csv_context.effective_csv)}")
 
 
-def load_merged_dataframe(loader: UnifiedDataLoader, csv_context: CSVContext) -> pd.DataFrame:
+def load_merged_dataframe(
+    loader: UnifiedDataLoader, csv_context: CSVContext, posts_workers: int = 1
+) -> pd.DataFrame:
     csv_filename = csv_context.effective_csv.name
     csv_df = loader.load_csv_data(csv_filename)
     llm_data = loader.parse_batch_output(filename=None)
     merged_df = loader.merge_data(csv_df, llm_data)
-    merged_df = normalize_dataset_records(csv_context.dataset_dir.name.lower(), merged_df)
-    merged_df = merged_df.copy()
+    merged_df = normalize_dataset_records(
+        csv_context.dataset_dir.name.lower(), merged_df, posts_workers
+    )
+    # No copy needed: merged_df is owned here (merge_data builds it and the
+    # normalizers return their own frame or hand it back untouched), and the
+    # columns below are assigned whole, never written in place.
     merged_df["source_csv"] = describe_path(csv_context.effective_csv)
+    _categorize_columns(merged_df)
     return merged_df
 
 
 def describe_path(path: Path) -> str:
-    try:
-        return str(path.relative_to(SCRIPT_ROOT))
-    except ValueError:
-        return str(path)
+    # Plain prefix test; same result as path.relative_to(SCRIPT_ROOT)
+    text = os.fspath(path)
+    if text.startswith(_SCRIPT_ROOT_PREFIX):
+        return text[len(_SCRIPT_ROOT_PREFIX):]
+    return "." if text == _SCRIPT_ROOT_STR else text
+
+
+def _merge_csv(
+    csv_context: CSVContext, posts_workers: int, columns: Optional[Sequence[str]]
+) -> pd.DataFrame:
+    loader = create_loader(csv_context)
+    merged_df = load_merged_dataframe(loader, csv_context, posts_workers)
+    if columns is not None:
+        # Drop the raw source columns here, before the frame is sent back and
+        # held until every CSV has been merged
+        merged_df = merged_df[[column for column in columns if column in merged_df.columns]]
+    return merged_df
 
 
 def merge_dataset_dataframe(
     dataset_dir: Path,
     csv_paths: List[Path],
     max_workers: int,
+    columns: Optional[Sequence[str]] = None,
 ) -> Tuple[pd.DataFrame, int, int]:
+    """Merge every CSV of a dataset into one frame.
+
+    When ``columns`` is given, each merged frame keeps only those columns.
+    """
     csv_contexts = [build_csv_context(dataset_dir, path) for path in csv_paths]
     total_csvs = len(csv_contexts)
     worker_count = min(max(1, max_workers), total_csvs)
 
     merged_frames: List[pd.DataFrame] = []
     csv_successes = 0
-
-    def merge_worker(csv_context: CSVContext) -> pd.DataFrame:
-        loader = create_loader(csv_context)
-        return load_merged_dataframe(loader, csv_context)
+    # Several CSVs already keep the workers busy; a lone CSV fans its posts out
+    posts_workers = max(1, max_workers) if total_csvs == 1 else 1
 
     print(f"→ Merging {total_csvs} CSV file(s) using {worker_count} worker(s)…")
 
-    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+    # The merge is CPU-bound pandas/Python work, so CSVs run in separate
+    # processes; a single CSV stays in-process and parallelizes its posts.
+    with (
+        ProcessPoolExecutor(max_workers=worker_count)
+        if worker_count > 1
+        else ThreadPoolExecutor(max_workers=1)
+    ) as executor:
         futures = {
-            executor.submit(merge_worker, csv_context): csv_context
+            executor.submit(_merge_csv, csv_context, posts_workers, columns): csv_context
             for csv_context in csv_contexts
         }
 
@@ -447,7 +526,7 @@ def merge_dataset_dataframe(
             csv_successes += 1
 
     combined_df = (
-        pd.concat(merged_frames, ignore_index=True)
+        _concat_frames(merged_frames, ignore_index=True)
         if merged_frames
         else pd.DataFrame()
     )
@@ -455,10 +534,34 @@ def merge_dataset_dataframe(
     return combined_df, csv_successes, total_csvs
 
 
-def write_normalized_parquet(dataset_dir: Path, combined_df: pd.DataFrame) -> Path:
+def _normalized_table(combined_df: pd.DataFrame) -> pa.Table:
     normalized_columns = [
         column for column in NORMALIZED_PROFILE_COLUMNS if column in combined_df.columns
     ]
+    # Categoricals are an in-memory detail: the file keeps plain value columns
+    # (parquet dictionary-encodes them anyway). Their object view only holds
+    # references to the category values; no other column is copied.
+    export_columns = {}
+    for column in normalized_columns:
+        series = combined_df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            series = series.astype(object)
+        export_columns[column] = series
+    return pa.Table.from_pandas(pd.DataFrame(export_columns, copy=False), preserve_index=False)
+
+
+def _write_parquet_table(table: pa.Table, output_path: Path) -> None:
+    pq.write_table(
+        table,
+        output_path,
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+        use_dictionary=True,
+    )
+
+
+def write_normalized_parquet(dataset_dir: Path, combined_df: pd.DataFrame) -> Path:
     output_path = dataset_dir / "normalized_profiles.parquet"
     if combined_df.empty:
         print(f"⚠️ Skipping parquet export for {describe_path(dataset_dir)} (no rows)")
@@ -466,12 +569,73 @@ def write_normalized_parquet(dataset_dir: Path, combined_df: pd.DataFrame) -> Pa
 
     dataset_dir.mkdir(parents=True, exist_ok=True)
     print(f"→ Exporting normalized profiles to {describe_path(output_path)}…")
-    normalized_df = combined_df.loc[:, normalized_columns].copy()
-    normalized_df.to_parquet(output_path, index=False)
+    _write_parquet_table(_normalized_table(combined_df), output_path)
     print(f"✅ Normalized parquet ready at {describe_path(output_path)}")
     return output_path
 
 
+def _csv_text_table(
+    df: pd.DataFrame, columns: List[str], shared: Optional[pa.Table] = None
+) -> Optional[pa.Table]:
+    """Return ``df[columns]`` as an all-string Arrow table for the CSV writer.
+
+    Non-object columns are rendered to text the way ``DataFrame.to_csv`` would
+    ("10.0", "True", "" for NaN). String columns already converted in
+    ``shared`` are reused instead of converted again. Returns None when an
+    object column holds anything but strings.
+    """
+    reused = {}
+    text_columns = {}
+    for column in columns:
+        series = df[column]
+        if (
+            shared is not None
+            and column in shared.column_names
+            and (series.dtype == object or isinstance(series.dtype, pd.CategoricalDtype))
+            and pa.types.is_string(shared.schema.field(column).type)
+        ):
+            reused[column] = shared.column(column)
+            continue
+        if series.dtype != object:
+            # Missing values become nulls, which Arrow writes as bare empty fields
+            series = series.astype(str).where(series.notna(), None)
+        text_columns[column] = series
+    try:
+        converted = pa.Table.from_pandas(
+            pd.DataFrame(text_columns, copy=False),
+            schema=pa.schema([(column, pa.string()) for column in text_columns]),
+            preserve_index=False,
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    return pa.table(
+        [reused[column] if column in reused else converted.column(column) for column in columns],
+        names=columns,
+    )
+
+
+def _write_csv_table(table: pa.Table, output_path: Path) -> None:
+    header = io.StringIO()
+    csv.writer(header, lineterminator="\n").writerow(table.column_names)
+    with output_path.open("wb") as out_fh:
+        out_fh.write(header.getvalue().encode("utf-8"))
+        pa_csv.write_csv(table, out_fh, write_options=pa_csv.WriteOptions(include_header=False))
+
+
+def write_frame_csv(df: pd.DataFrame, columns: List[str], output_path: Path) -> None:
+    """Write ``df[columns]`` as CSV through Arrow's C++ writer.
+
+    Values read back the same as with ``DataFrame.to_csv``; Arrow merely quotes
+    every string field. Object columns holding anything but strings fall back
+    to ``to_csv``.
+    """
+    table = _csv_text_table(df, columns)
+    if table is None:
+        df.to_csv(output_path, index=False, columns=columns)
+        return
+    _write_csv_table(table, output_path)
+
+
 def assign_combined_lance_ids(
     instagram_df: pd.DataFrame, tiktok_df: pd.DataFrame
 ) -> None:
@@ -505,15 +669,11 @@ def assign_combined_lance_ids(
                 pass
         return candidate
 
-    insta_col = instagram_df.columns.get_loc("lance_db_id")
-    for idx in range(len(instagram_df)):
-        current = _normalize_id(instagram_df.iat[idx, insta_col])
-        instagram_df.iat[idx, insta_col] = _allocate(current)
-
-    tiktok_col = tiktok_df.columns.get_loc("lance_db_id")
-    for idx in range(len(tiktok_df)):
-        current = _normalize_id(tiktok_df.iat[idx, tiktok_col])
-        tiktok_df.iat[idx, tiktok_col] = _allocate(current)
+    # Only collision resolution is sequential; ids are normalized column-wise
+    # and the allocated ids are written back as whole columns.
+    for frame in (instagram_df, tiktok_df):
+        current_ids = _string_column(frame, "lance_db_id").str.strip().tolist()
+        frame["lance_db_id"] = [_allocate(current) for current in current_ids]
 
 
 def process_dataset(
@@ -521,10 +681,12 @@ def process_dataset(
     csv_paths: List[Path],
     max_workers: int,
 ) -> Tuple[int, int, int]:
+    # Only the parquet columns are exported, so the raw ones are never kept
     combined_df, csv_successes, total_csvs = merge_dataset_dataframe(
         dataset_dir,
         csv_paths,
         max_workers,
+        columns=NORMALIZED_PROFILE_COLUMNS,
     )
 
     if combined_df.empty:
@@ -560,7 +722,7 @@ def process_combined_platforms(args: argparse.Namespace, root_dir: Path) -> int:
 
     assign_combined_lance_ids(instagram_df, tiktok_df)
 
-    combined_df = pd.concat(
+    combined_df = _concat_frames(
         [instagram_df, tiktok_df], ignore_index=True, sort=False
     )
 
@@ -572,10 +734,23 @@ def process_combined_platforms(args: argparse.Namespace, root_dir: Path) -> int:
     ]
 
     combined_csv_path = combined_dir / COMBINED_FILENAME
+    parquet_path = combined_dir / "normalized_profiles.parquet"
     print(f"→ Writing combined CSV to {describe_path(combined_csv_path)}")
-    combined_df.to_csv(combined_csv_path, index=False, columns=ordered_columns)
-
-    write_normalized_parquet(combined_dir, combined_df)
+    print(f"→ Exporting normalized profiles to {describe_path(parquet_path)}…")
+
+    # Convert to Arrow once: the CSV reuses the parquet table's string columns,
+    # and both C++ writers release the GIL, so the two files are written
+    # side by side.
+    parquet_table = _normalized_table(combined_df)
+    csv_table = _csv_text_table(combined_df, ordered_columns, shared=parquet_table)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parquet_future = executor.submit(_write_parquet_table, parquet_table, parquet_path)
+        if csv_table is None:
+            combined_df.to_csv(combined_csv_path, index=False, columns=ordered_columns)
+        else:
+            _write_csv_table(csv_table, combined_csv_path)
+        parquet_future.result()
+    print(f"✅ Normalized parquet ready at {describe_path(parquet_path)}")
 
     print(
         f"✅ Combined {len(instagram_df):,} Instagram rows"
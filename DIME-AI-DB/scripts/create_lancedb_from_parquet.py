@@ -3,46 +3,46 @@
 Create a LanceDB table from `normalized_profiles.parquet` via a staged pipeline.
 
 Stages:
-  1. Load parquet into a Polars DataFrame.
-  2. Build normalized facet records (profile/posts) from each profile row.
-  3. Fit a TF-IDF vectorizer.
-  4. Persist the vectorizer artifact and add per-record sparse TF-IDF features.
-  5. Fetch embeddings from DeepInfra asynchronously (batch size 256, <=190 concurrent requests) using aiometer with retries.
-  6. Build an Arrow schema from the enriched records.
-  7. Write records into LanceDB.
+  1. Stream the parquet as Polars DataFrames, one batch of profile rows at a time.
+  2. Sample the first facet texts (profile/posts) for the TF-IDF fit and infer
+     the record column types; the scan stops once both are complete.
+  3. Fit a TF-IDF vectorizer on the sampled texts.
+  4. Persist the vectorizer artifact.
+  5. Stream the batches again and, per batch: build the records, add sparse
+     TF-IDF features, fetch embeddings from DeepInfra asynchronously (batch
+     size 256, <=190 concurrent requests) using aiometer with retries, and
+     write them into LanceDB (the Arrow schema comes from the stage 2 types).
 
 This script only uses DeepInfra for embeddings. Set `DEEPINFRA_API_KEY` or pass
 `--deepinfra-api-key`. The embedding batch size is fixed at 256 per API request.
 """
 import argparse
 import asyncio
+import base64
 import functools
 import gc
 import json
 import logging
 import math
+import multiprocessing
 import os
-import re
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+import aiohttp
 import aiometer
 import joblib
 import lancedb
 import numpy as np
 import pyarrow as pa
+import pyarrow.parquet as pq
 import polars as pl
+import scipy.sparse as sp
 from dotenv import load_dotenv
-from openai import (
-    APIConnectionError,
-    APIError,
-    APITimeoutError,
-    AsyncOpenAI,
-    RateLimitError,
-)
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.pipeline import Pipeline
 from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
 try:
@@ -55,17 +55,37 @@ except Exception:  # pragma: no cover - optional dependency guard
     cp = None  # type: ignore
     cudf = None  # type: ignore
     _HAS_CUML = False
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 LOGGER = logging.getLogger("create_lancedb")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
 
 EMBED_BATCH_SIZE = 256
+# Profile rows per streamed parquet batch; bounds the records held in memory
+PARQUET_BATCH_ROWS = 50_000
+# Record texts the TF-IDF fit samples; bounds the texts held in memory
+TFIDF_FIT_TEXTS = 200_000
 MAX_CONCURRENT_REQUESTS = 190
 MAX_RETRY_ATTEMPTS = 5
+# Per-request timeout for embedding calls (matches the OpenAI client default)
+EMBED_REQUEST_TIMEOUT_S = 600
 
 # Load environment variables from .env if present (e.g., DEEPINFRA_API_KEY).
 load_dotenv()
 
+# Every character str.strip() and re's \s treat as whitespace, spelled out so
+# the Polars kernels trim and collapse exactly what clean_text/coalesce do.
+_PY_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004"
+    "\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+_PY_WHITESPACE_RUN = "[" + "".join(f"\\x{{{ord(ch):x}}}" for ch in _PY_WHITESPACE) + "]+"
+_TRUE_STRINGS = ["true", "t", "1", "yes", "y"]
+_FALSE_STRINGS = ["false", "f", "0", "no", "n"]
+
 
 @dataclass(frozen=True)
 class PipelineConfig:
@@ -80,6 +100,7 @@ class PipelineConfig:
     tfidf_min_df: int
     ngram_range: Tuple[int, int]
     tfidf_backend: str
+    tfidf_fit_texts: int
     tfidf_workers: int
     vectorizer_path: str
     embed_model: str
@@ -104,7 +125,30 @@ class DeepInfraEmbedder:
             raise ValueError("DeepInfra API key is required; set DEEPINFRA_API_KEY or use --deepinfra-api-key")
         self.endpoint = endpoint.rstrip("/")
         self.concurrency = max(1, min(concurrency, MAX_CONCURRENT_REQUESTS))
-        self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.endpoint)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so it binds to the running event loop; one keep-alive
+        # connection pool serves every batch of every embed() call.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60),
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=aiohttp.ClientTimeout(total=EMBED_REQUEST_TIMEOUT_S),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _post_embeddings(self, batch_texts: List[str]) -> List[Dict[str, Any]]:
+        payload = {"model": self.model, "input": batch_texts, "encoding_format": "base64"}
+        async with self._get_session().post(f"{self.endpoint}/embeddings", json=payload) as response:
+            response.raise_for_status()
+            body = await response.read()
+        return _json_loads(body).get("data") or []
 
     async def embed(self, texts: Sequence[str]) -> List[np.ndarray]:
         if not texts:
@@ -124,31 +168,29 @@ class DeepInfraEmbedder:
                 wait=wait_exponential_jitter(initial=1, max=10),
                 retry=retry_if_exception_type(
                     (
-                        APIError,
-                        APITimeoutError,
-                        APIConnectionError,
-                        RateLimitError,
+                        aiohttp.ClientError,
+                        asyncio.TimeoutError,
                         RuntimeError,
                     )
                 ),
             ):
                 with attempt:
-                    response = await self.client.embeddings.create(
-                        model=self.model,
-                        input=batch_texts,
-                        encoding_format="float",
-                    )
+                    items = await self._post_embeddings(batch_texts)
 
-            items = response.data or []
             if len(items) != len(batch_texts):
                 raise RuntimeError(
                     f"Embedding count mismatch (expected {len(batch_texts)}, got {len(items)})"
                 )
             for offset, item in enumerate(items):
-                embedding = item.embedding
+                embedding = item.get("embedding")
                 if embedding is None:
                     raise RuntimeError("Missing embedding in DeepInfra response")
-                results[start + offset] = np.asarray(embedding, dtype=np.float32)
+                if isinstance(embedding, str):
+                    # base64 of little-endian float32s
+                    vector = np.frombuffer(base64.b64decode(embedding), dtype="<f4")
+                else:
+                    vector = np.asarray(embedding, dtype=np.float32)
+                results[start + offset] = vector
 
         max_concurrency = min(self.concurrency, len(batches)) if batches else 1
         await aiometer.run_all(
@@ -208,8 +250,18 @@ def coalesce(*vals, default="") -> str:
 def clean_text(s: Optional[str]) -> str:
     if s is None:
         return ""
-    s = re.sub(r"\s+", " ", str(s)).strip()
-    return s
+    # str.split() breaks on the same whitespace as re's \s, in C
+    return " ".join(str(s).split())
+
+
+def _json_loads(value: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # orjson is strict about NaN/Infinity; let the stdlib parser decide.
+            pass
+    return json.loads(value)
 
 
 def normalize_field_value(value: Any) -> Any:
@@ -231,52 +283,30 @@ def normalize_field_value(value: Any) -> Any:
     return value
 
 
-def build_profile_text(row: Dict[str, Any], text_trunc: int, include_keywords: bool = True) -> str:
-    parts: List[str] = []
-    parts.append(coalesce(row.get("display_name"), row.get("username")))
-    occ = clean_text(row.get("occupation"))
-    if occ:
-        parts.append(occ)
-    bio = clean_text(row.get("biography"))
-    if bio:
-        parts.append(bio)
-    if include_keywords:
-        for i in range(1, 11):
-            ki = clean_text(row.get(f"keyword{i}"))
-            if ki:
-                parts.append(ki)
-    txt = " • ".join([p for p in parts if p])
-    return txt[:text_trunc] if text_trunc and text_trunc > 0 else txt
-
-
 def _normalize_hashtags(raw: Any) -> List[str]:
-    tags: List[str] = []
-
-    def add_token(token: str) -> None:
-        cleaned = clean_text(token).replace("#", " ")
-        for part in cleaned.split():
-            part = part.strip("# ")
-            if part:
-                tags.append(part)
-
-    if raw is None or (isinstance(raw, float) and math.isnan(raw)):
-        return tags
-
-    if isinstance(raw, str):
-        add_token(raw)
-    elif isinstance(raw, (list, tuple, set)):
-        for entry in raw:
-            if isinstance(entry, (list, tuple, set)):
-                tags.extend(_normalize_hashtags(entry))
-            else:
-                add_token(str(entry))
-    elif isinstance(raw, dict):
-        for value in raw.values():
-            tags.extend(_normalize_hashtags(value))
-    else:
-        add_token(str(raw))
-
-    return tags
+    """Split hashtag values (strings or nested lists/dicts of them) into bare tags.
+
+    Nested containers are flattened with an explicit stack; other entries of a
+    list are tokenized as their ``str()``. All leaves are split on whitespace
+    and ``#`` in one pass.
+    """
+    leaves: List[str] = []
+    stack = [raw]
+    while stack:
+        value = stack.pop()
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            continue
+        if isinstance(value, str):
+            leaves.append(value)
+        elif isinstance(value, (list, tuple, set)):
+            # Pushed in reverse so entries pop in their original order
+            for entry in reversed(list(value)):
+                stack.append(entry if isinstance(entry, (list, tuple, set)) else str(entry))
+        elif isinstance(value, dict):
+            stack.extend(reversed(list(value.values())))
+        else:
+            leaves.append(str(value))
+    return " ".join(leaves).replace("#", " ").split()
 
 
 def extract_posts_chunks(posts_field: Any, posts_max: int = 5, snippet_max_len: Optional[int] = None) -> List[str]:
@@ -291,7 +321,7 @@ def extract_posts_chunks(posts_field: Any, posts_max: int = 5, snippet_max_len:
         if not s:
             return []
         try:
-            parsed = json.loads(s)
+            parsed = _json_loads(s)
         except Exception:
             text = clean_text(s)
             if snippet_max_len is not None and snippet_max_len > 0:
@@ -349,17 +379,6 @@ def extract_posts_chunks(posts_field: Any, posts_max: int = 5, snippet_max_len:
     return [c for c in captions if c]
 
 
-def batched(iterable: Iterable[Any], n: int) -> Iterable[List[Any]]:
-    buf: List[Any] = []
-    for item in iterable:
-        buf.append(item)
-        if len(buf) >= n:
-            yield buf
-            buf = []
-    if buf:
-        yield buf
-
-
 def load_dataframe(parquet_path: str, sample_rows: Optional[int] = None) -> pl.DataFrame:
     df = pl.read_parquet(parquet_path)
     if sample_rows and sample_rows > 0 and sample_rows < df.height:
@@ -367,58 +386,228 @@ def load_dataframe(parquet_path: str, sample_rows: Optional[int] = None) -> pl.D
     return df
 
 
-def make_rows(df: pl.DataFrame, text_trunc: int, posts_max: int) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    columns = df.columns
-    for row in df.iter_rows(named=True):
-        profile_text = build_profile_text(row, text_trunc=text_trunc)
-        posts_chunks = extract_posts_chunks(row.get("posts"), posts_max=posts_max) if "posts" in row else []
+def iter_dataframes(parquet_path: str, sample_rows: Optional[int] = None) -> Iterator[pl.DataFrame]:
+    """Yield the parquet's rows in order as frames of ``PARQUET_BATCH_ROWS`` rows.
+
+    The file is read batch by batch; a sample (deterministic, seed 42) is
+    still drawn from the whole frame first.
+    """
+    if sample_rows and sample_rows > 0:
+        yield from load_dataframe(parquet_path, sample_rows).iter_slices(PARQUET_BATCH_ROWS)
+        return
+    for batch in pq.ParquetFile(parquet_path).iter_batches(batch_size=PARQUET_BATCH_ROWS):
+        yield pl.from_arrow(batch)
+
+
+def _column(df: pl.DataFrame, name: str) -> pl.Series:
+    if name in df.columns:
+        return df.get_column(name)
+    return pl.Series(name, [None] * df.height)
+
+
+def _text_series(series: pl.Series) -> pl.Series:
+    """Vectorized ``coalesce(value)`` over one column."""
+    if series.dtype == pl.Utf8:
+        return series.str.strip_chars(_PY_WHITESPACE).fill_null("")
+    return pl.Series(series.name, [coalesce(v) for v in series.to_list()], dtype=pl.Utf8)
+
+
+def _clean_series(series: pl.Series) -> pl.Series:
+    """Vectorized ``clean_text(value)`` over one column."""
+    if series.dtype == pl.Utf8:
+        return series.str.replace_all(_PY_WHITESPACE_RUN, " ").str.strip_chars(" ").fill_null("")
+    return pl.Series(series.name, [clean_text(v) for v in series.to_list()], dtype=pl.Utf8)
+
+
+def _first_non_empty(*candidates: pl.Series) -> pl.Series:
+    """Row-wise ``coalesce``: the first non-empty value of ``candidates``."""
+    expr = pl.lit("")
+    for candidate in reversed(candidates):
+        expr = pl.when(candidate != "").then(candidate).otherwise(expr)
+    return pl.select(expr).to_series()
+
+
+def _join_non_empty(parts: Sequence[pl.Series], separator: str) -> pl.Series:
+    """Row-wise ``separator.join`` of the non-empty values of ``parts``."""
+    joined = parts[0]
+    for part in parts[1:]:
+        joined = pl.select(
+            pl.when(joined == "")
+            .then(part)
+            .when(part == "")
+            .then(joined)
+            .otherwise(pl.concat_str([joined, pl.lit(separator), part]))
+        ).to_series()
+    return joined
+
+
+def _number_series(series: pl.Series, dtype: pl.DataType, convert) -> pl.Series:
+    """Vectorized ``inty``/``floaty`` (passed as ``convert``) over one column.
+
+    Text is parsed by Polars; the rare values it rejects but Python's
+    int()/float() accept (e.g. "1_000", non-ASCII digits) go through
+    ``convert`` so the results match. Integers beyond int64, which the
+    LanceDB column could not hold anyway, come back missing.
+    """
+    source = series.dtype
+    if source == pl.Utf8:
+        text = series.str.replace_all(",", "", literal=True).str.strip_chars(_PY_WHITESPACE)
+        parsed = text.cast(dtype, strict=False)
+        retry = parsed.is_null() & (text.fill_null("") != "")
+        if not retry.any():
+            return parsed
+        values = parsed.to_list()
+        for idx in retry.arg_true().to_list():
+            values[idx] = convert(series[idx])
+        return pl.Series(series.name, values, dtype=dtype, strict=False)
+    if source == pl.Boolean or (dtype == pl.Int64 and source.is_float()):
+        # str(True) / str(1.0) never parse as an int, so these are all missing
+        return pl.Series(series.name, [None] * len(series), dtype=dtype)
+    if source.is_integer() or source.is_float():
+        return series.fill_nan(None).cast(dtype) if source.is_float() else series.cast(dtype)
+    return pl.Series(series.name, [convert(v) for v in series.to_list()], dtype=dtype, strict=False)
+
+
+def _bool_series(series: pl.Series) -> pl.Series:
+    """Vectorized ``booly(value)`` over one column."""
+    source = series.dtype
+    if source == pl.Boolean:
+        return series
+    if source.is_integer():
+        return series != 0
+    if source.is_float():
+        return series.fill_nan(None) != 0
+    if source == pl.Utf8:
+        lowered = series.str.strip_chars(_PY_WHITESPACE).str.to_lowercase()
+        return pl.select(
+            pl.when(lowered.is_in(_TRUE_STRINGS))
+            .then(True)
+            .when(lowered.is_in(_FALSE_STRINGS))
+            .then(False)
+            .otherwise(None)
+        ).to_series()
+    return pl.Series(series.name, [booly(v) for v in series.to_list()], dtype=pl.Boolean)
+
+
+def _field_values(series: pl.Series) -> List[Any]:
+    """Vectorized ``normalize_field_value`` over one column."""
+    source = series.dtype
+    if source == pl.Utf8 or source == pl.Boolean or source.is_integer():
+        return series.to_list()
+    if source.is_float():
+        return series.fill_nan(None).to_list()
+    return [normalize_field_value(v) for v in series.to_list()]
+
+
+def _profile_texts(df: pl.DataFrame, text_trunc: int) -> pl.Series:
+    profile_parts = [
+        _first_non_empty(_text_series(_column(df, "display_name")), _text_series(_column(df, "username"))),
+        _clean_series(_column(df, "occupation")),
+        _clean_series(_column(df, "biography")),
+    ]
+    profile_parts.extend(_clean_series(_column(df, f"keyword{i}")) for i in range(1, 11))
+    profile_texts = _join_non_empty(profile_parts, " • ")
+    if text_trunc and text_trunc > 0:
+        profile_texts = profile_texts.str.slice(0, text_trunc)
+    return profile_texts
+
+
+def _posts_chunks(df: pl.DataFrame, posts_max: int) -> List[List[str]]:
+    if "posts" not in df.columns:
+        return [[] for _ in range(df.height)]
+    return [
+        extract_posts_chunks(value, posts_max=posts_max)
+        for value in df.get_column("posts").to_list()
+    ]
+
+
+def _record_texts(profile_texts: List[str], posts_chunks_list: List[List[str]]) -> List[str]:
+    """Texts of the records ``make_rows`` emits for these rows, in record order."""
+    texts: List[str] = []
+    for profile_text, posts_chunks in zip(profile_texts, posts_chunks_list):
+        if profile_text:
+            texts.append(profile_text)
         posts_text = " \n ".join(posts_chunks)
+        if posts_text:
+            texts.append(posts_text)
+    return texts
+
+
+def _meta_columns(df: pl.DataFrame) -> Dict[str, Any]:
+    """Metadata shared by a row's facet records, one Series or list per field."""
+    def text(name: str) -> pl.Series:
+        return _text_series(_column(df, name))
+
+    def integer(name: str) -> pl.Series:
+        return _number_series(_column(df, name), pl.Int64, inty)
+
+    def real(name: str) -> pl.Series:
+        return _number_series(_column(df, name), pl.Float64, floaty)
+
+    def flag(name: str) -> pl.Series:
+        return _bool_series(_column(df, name))
+
+    meta_columns: Dict[str, Any] = dict(
+        lance_db_id=_first_non_empty(text("lance_db_id"), text("platform_id"), text("username")),
+        platform=text("platform"),
+        platform_id=text("platform_id"),
+        username=text("username"),
+        display_name=text("display_name"),
+        biography=text("biography"),
+        external_url=text("external_url"),
+        profile_url=text("profile_url"),
+        profile_image_url=text("profile_image_url"),
+        followers=integer("followers"),
+        following=integer("following"),
+        likes_total=integer("likes_total"),
+        posts_count=integer("posts_count"),
+        engagement_rate=real("engagement_rate"),
+        median_view_count_last10=real("median_view_count_last10"),
+        median_like_count_last10=real("median_like_count_last10"),
+        median_comment_count_last10=real("median_comment_count_last10"),
+        reel_post_ratio_last10=real("reel_post_ratio_last10"),
+        total_img_posts_ig=integer("total_img_posts_ig"),
+        total_reels_ig=integer("total_reels_ig"),
+        individual_vs_org_score=real("individual_vs_org_score"),
+        generational_appeal_score=real("generational_appeal_score"),
+        professionalization_score=real("professionalization_score"),
+        relationship_status_score=real("relationship_status_score"),
+        occupation=text("occupation"),
+        is_verified=flag("is_verified"),
+        is_private=flag("is_private"),
+        is_commerce_user=flag("is_commerce_user"),
+        source_batch=text("source_batch"),
+        llm_processed=flag("llm_processed"),
+        source_csv=text("source_csv"),
+        prompt_file=text("prompt_file"),
+        raw_response=text("raw_response"),
+        processing_error=text("processing_error"),
+    )
+    for col in df.columns:
+        if col not in meta_columns and col not in {"vector_id", "content_type", "text"}:
+            meta_columns[col] = _field_values(df.get_column(col))
+    return meta_columns
 
-        lance_db_id = coalesce(row.get("lance_db_id"), row.get("platform_id"), row.get("username"))
-        row_values = {col: normalize_field_value(row.get(col)) for col in columns}
-
-        meta_common = dict(
-            lance_db_id=lance_db_id,
-            platform=coalesce(row.get("platform")),
-            platform_id=coalesce(row.get("platform_id")),
-            username=coalesce(row.get("username")),
-            display_name=coalesce(row.get("display_name")),
-            biography=coalesce(row.get("biography")),
-            external_url=coalesce(row.get("external_url")),
-            profile_url=coalesce(row.get("profile_url")),
-            profile_image_url=coalesce(row.get("profile_image_url")),
-            followers=inty(row.get("followers")),
-            following=inty(row.get("following")),
-            likes_total=inty(row.get("likes_total")),
-            posts_count=inty(row.get("posts_count")),
-            engagement_rate=floaty(row.get("engagement_rate")),
-            median_view_count_last10=floaty(row.get("median_view_count_last10")),
-            median_like_count_last10=floaty(row.get("median_like_count_last10")),
-            median_comment_count_last10=floaty(row.get("median_comment_count_last10")),
-            reel_post_ratio_last10=floaty(row.get("reel_post_ratio_last10")),
-            total_img_posts_ig=inty(row.get("total_img_posts_ig")),
-            total_reels_ig=inty(row.get("total_reels_ig")),
-            individual_vs_org_score=floaty(row.get("individual_vs_org_score")),
-            generational_appeal_score=floaty(row.get("generational_appeal_score")),
-            professionalization_score=floaty(row.get("professionalization_score")),
-            relationship_status_score=floaty(row.get("relationship_status_score")),
-            occupation=coalesce(row.get("occupation")),
-            is_verified=booly(row.get("is_verified")),
-            is_private=booly(row.get("is_private")),
-            is_commerce_user=booly(row.get("is_commerce_user")),
-            source_batch=coalesce(row.get("source_batch")),
-            llm_processed=booly(row.get("llm_processed")),
-            source_csv=coalesce(row.get("source_csv")),
-            prompt_file=coalesce(row.get("prompt_file")),
-            raw_response=coalesce(row.get("raw_response")),
-            processing_error=coalesce(row.get("processing_error")),
-        )
 
-        for col, value in row_values.items():
-            if col not in meta_common and col not in {"vector_id", "content_type", "text"}:
-                meta_common[col] = value
+def make_rows(df: pl.DataFrame, text_trunc: int, posts_max: int) -> List[Dict[str, Any]]:
+    # Every field is converted column-at-a-time by Polars (same results as
+    # coalesce/inty/floaty/booly/clean_text per row); only the posts JSON is
+    # still parsed row by row.
+    meta_columns = _meta_columns(df)
+    keys = list(meta_columns)
+    value_lists = [
+        values.to_list() if isinstance(values, pl.Series) else values
+        for values in meta_columns.values()
+    ]
+    metas = [dict(zip(keys, values)) for values in zip(*value_lists)]
+    posts_chunks_list = _posts_chunks(df, posts_max)
 
+    rows: List[Dict[str, Any]] = []
+    for meta_common, profile_text, posts_chunks in zip(
+        metas, _profile_texts(df, text_trunc).to_list(), posts_chunks_list
+    ):
+        lance_db_id = meta_common["lance_db_id"]
+        posts_text = " \n ".join(posts_chunks)
         if profile_text:
             rows.append(
                 {
@@ -441,13 +630,52 @@ def make_rows(df: pl.DataFrame, text_trunc: int, posts_max: int) -> List[Dict[st
     return rows
 
 
+def fit_hashing_tfidf(
+    text_batches: Iterable[List[str]],
+    n_features: int,
+    min_df: int,
+    ngram_range: Tuple[int, int],
+) -> Pipeline:
+    """Fit hashed TF-IDF in one streaming pass over ``text_batches``.
+
+    The hashing stage has no vocabulary, so only the per-bucket document
+    frequencies are accumulated; the IDF weights match ``TfidfTransformer``'s
+    smoothed formula. Buckets seen in fewer than ``min_df`` documents get a
+    zero weight and drop out of the features.
+    """
+    hasher = HashingVectorizer(
+        strip_accents="unicode",
+        lowercase=True,
+        n_features=n_features,
+        ngram_range=ngram_range,
+        alternate_sign=False,
+        norm=None,
+    )
+    doc_freq = np.zeros(n_features, dtype=np.int64)
+    n_docs = 0
+    for texts in text_batches:
+        counts = hasher.transform([str(t) for t in texts])
+        # Each CSR row lists a bucket at most once, so this counts documents
+        doc_freq += np.bincount(counts.indices, minlength=n_features)
+        n_docs += counts.shape[0]
+
+    idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1
+    idf[doc_freq < min_df] = 0
+    transformer = TfidfTransformer()
+    transformer.idf_ = idf
+    return Pipeline([("hash", hasher), ("tfidf", transformer)])
+
+
 def fit_tfidf(
-    texts: List[str],
+    text_batches: Iterable[List[str]],
     max_features: int,
     min_df: int,
     ngram_range: Tuple[int, int],
     backend: str,
 ):
+    if backend == "hashing":
+        return fit_hashing_tfidf(text_batches, max_features, min_df, ngram_range)
+    texts = [text for batch in text_batches for text in batch]
     if backend == "cuml":
         if not _HAS_CUML:
             raise RuntimeError("cuML requested but unavailable")
@@ -470,63 +698,126 @@ def fit_tfidf(
     return vec
 
 
-def add_sparse_fields(
-    records: List[Dict[str, Any]],
-    vectorizer,
-    batch_size: int = 4096,
-    workers: int = 1,
-    backend: str = "sklearn",
-) -> None:
-    use_cuml = (
+# Vectorizer installed once per TF-IDF worker process by _init_tfidf_worker
+_WORKER_VECTORIZER = None
+
+
+def _init_tfidf_worker(vectorizer) -> None:
+    global _WORKER_VECTORIZER
+    _WORKER_VECTORIZER = vectorizer
+
+
+def _transform_texts(texts: List[str]):
+    """Transform one batch of texts with the worker's vectorizer."""
+    return _WORKER_VECTORIZER.transform(texts)
+
+
+def _uses_cuml(vectorizer, backend: str) -> bool:
+    return (
         backend == "cuml"
         and _HAS_CUML
         and CuMLTfidfVectorizer is not None
         and isinstance(vectorizer, CuMLTfidfVectorizer)
     )
+
+
+def tfidf_process_pool(vectorizer, workers: int, backend: str) -> Optional[ProcessPoolExecutor]:
+    """Process pool for TF-IDF transforms, or ``None`` to transform in-process.
+
+    Tokenization is pure Python and holds the GIL, so batches fan out to
+    processes that each receive the fitted vectorizer once at startup. cuML
+    transforms stay on the GPU in the calling process.
+    """
+    if workers is None or workers <= 1 or _uses_cuml(vectorizer, backend):
+        return None
+    # Spawned rather than forked: lancedb's runtime threads are not fork-safe
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_tfidf_worker,
+        initargs=(vectorizer,),
+    )
+
+
+def sparse_feature_arrays(
+    records: List[Dict[str, Any]],
+    vectorizer,
+    batch_size: int = 4096,
+    workers: int = 1,
+    backend: str = "sklearn",
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> Tuple[pa.ChunkedArray, pa.ChunkedArray]:
+    """TF-IDF features of each record's text as ``(sparse_indices, sparse_values)``.
+
+    Both are row-aligned with ``records``: ``list<int32>`` / ``list<float32>``
+    arrays that wrap the CSR buffers of each transformed batch directly.
+    Batches run on ``pool`` when given (see ``tfidf_process_pool``), otherwise
+    on a pool of ``workers`` processes created for this call.
+    """
+    use_cuml = _uses_cuml(vectorizer, backend)
     if use_cuml:
-        workers = 1
+        # The GPU transforms the whole record batch at once, so its result
+        # crosses to the host in one copy per CSR buffer
+        batch_size = max(len(records), 1)
 
     def ranges() -> Iterable[Tuple[int, int]]:
         for start in range(0, len(records), batch_size):
             end = min(start + batch_size, len(records))
             yield start, end
 
-    def process_batch(bounds: Tuple[int, int]):
-        start, end = bounds
-        batch_texts = [records[i]["text"] for i in range(start, end)]
-        if use_cuml:
-            batch_series = cudf.Series(batch_texts, dtype="str")
-            X = vectorizer.transform(batch_series)
-            X = X.get()
-        else:
-            batch_texts = [str(t) for t in batch_texts]
-            X = vectorizer.transform(batch_texts)
+    def batch_texts() -> Iterable[List[str]]:
+        for start, end in ranges():
+            yield [str(records[i]["text"]) for i in range(start, end)]
+
+    def process_batch(texts: List[str]):
         if use_cuml:
+            X_gpu = vectorizer.transform(cudf.Series(texts, dtype="str"))
+            # Narrow the buffers on device so fewer bytes cross to the host
+            X = sp.csr_matrix(
+                (
+                    cp.asnumpy(X_gpu.data.astype(cp.float32, copy=False)),
+                    cp.asnumpy(X_gpu.indices.astype(cp.int32, copy=False)),
+                    cp.asnumpy(X_gpu.indptr.astype(cp.int32, copy=False)),
+                ),
+                shape=X_gpu.shape,
+            )
+            del X_gpu
             cp.get_default_memory_pool().free_all_blocks()
-        return start, end, X
+            return X
+        return vectorizer.transform(texts)
 
-    if workers is None or workers < 1:
-        workers = 1
+    own_pool = None
+    if pool is None and not use_cuml:
+        pool = own_pool = tfidf_process_pool(vectorizer, workers, backend)
 
-    if workers == 1:
-        iterator = map(process_batch, ranges())
+    if pool is None:
+        iterator = map(process_batch, batch_texts())
     else:
-        executor = ThreadPoolExecutor(max_workers=workers)
-        iterator = executor.map(process_batch, ranges())
+        iterator = pool.map(_transform_texts, batch_texts())
 
+    index_chunks: List[pa.Array] = []
+    value_chunks: List[pa.Array] = []
     try:
-        for start, end, X in iterator:
-            for i, row in enumerate(range(start, end)):
-                csr = X[i]
-                indices = csr.indices.astype(np.int32)
-                values = csr.data.astype(np.float32)
-                records[row]["sparse_indices"] = indices.tolist()
-                records[row]["sparse_values"] = values.tolist()
+        for X in iterator:
+            # Hashed buckets below min_df carry zero weight; drop those entries
+            X.eliminate_zeros()
+            # A CSR row's entries are X.indices/X.data[indptr[i]:indptr[i + 1]],
+            # which is exactly Arrow's list layout with indptr as the offsets.
+            offsets = pa.array(X.indptr.astype(np.int32, copy=False))
+            index_chunks.append(
+                pa.ListArray.from_arrays(offsets, pa.array(X.indices.astype(np.int32, copy=False)))
+            )
+            value_chunks.append(
+                pa.ListArray.from_arrays(offsets, pa.array(X.data.astype(np.float32, copy=False)))
+            )
             del X
-            gc.collect()
     finally:
-        if workers > 1 and "executor" in locals():
-            executor.shutdown(wait=True)
+        if own_pool is not None:
+            own_pool.shutdown(wait=True)
+    return (
+        pa.chunked_array(index_chunks, type=CORE_FIELD_TYPES["sparse_indices"]),
+        pa.chunked_array(value_chunks, type=CORE_FIELD_TYPES["sparse_values"]),
+    )
 
 
 def infer_arrow_type(value) -> pa.DataType:
@@ -558,29 +849,53 @@ def infer_arrow_type_from_records(records: List[Dict[str, Any]], key: str) -> pa
     return pa.null()
 
 
-def build_schema_from_records(records: List[Dict[str, Any]]) -> pa.Schema:
-    if not records:
+CORE_FIELD_TYPES = {
+    "vector_id": pa.string(),
+    "content_type": pa.string(),
+    "text": pa.string(),
+    "biography": pa.string(),
+    "sparse_indices": pa.list_(pa.int32()),
+    "sparse_values": pa.list_(pa.float32()),
+}
+
+
+def infer_column_types(meta_columns: Dict[str, Any], record_types: Dict[str, pa.DataType]) -> None:
+    """Update ``record_types`` (keys in record order) from one batch's ``_meta_columns``.
+
+    Keys still typed null take the type of their first non-null value, so
+    feeding every batch in order gives the types inference over all rows at
+    once would.
+    """
+    if not record_types:
+        for key in ("vector_id", "content_type", "text", *meta_columns):
+            record_types[key] = pa.null()
+    for key, dtype in record_types.items():
+        if not pa.types.is_null(dtype) or key in CORE_FIELD_TYPES:
+            continue
+        values = meta_columns[key]
+        if isinstance(values, pl.Series):
+            values = values.drop_nulls().head(1).to_list()
+        record_types[key] = infer_arrow_type(next((v for v in values if v is not None), None))
+
+
+def _types_resolved(record_types: Dict[str, pa.DataType]) -> bool:
+    return bool(record_types) and all(
+        key in CORE_FIELD_TYPES or not pa.types.is_null(dtype)
+        for key, dtype in record_types.items()
+    )
+
+
+def build_schema_from_types(record_types: Dict[str, pa.DataType], vector_dim: int) -> pa.Schema:
+    """Build the table schema: the record columns, the sparse TF-IDF columns and
+    a trailing ``embedding`` column of ``vector_dim`` floats."""
+    if not record_types:
         raise ValueError("No records available to infer schema")
 
-    fields = []
-    vector_dim = len(records[0].get("embedding", []))
-    core_types = {
-        "vector_id": pa.string(),
-        "content_type": pa.string(),
-        "text": pa.string(),
-        "biography": pa.string(),
-        "embedding": pa.list_(pa.float32(), vector_dim) if vector_dim else pa.list_(pa.float32()),
-        "sparse_indices": pa.list_(pa.int32()),
-        "sparse_values": pa.list_(pa.float32()),
-    }
-
-    first = records[0]
-    for key in first.keys():
-        if key in core_types:
-            fields.append(pa.field(key, core_types[key]))
-        else:
-            dtype = infer_arrow_type_from_records(records, key)
-            fields.append(pa.field(key, dtype))
+    columns = dict(record_types)
+    columns.setdefault("sparse_indices", pa.null())
+    columns.setdefault("sparse_values", pa.null())
+    fields = [pa.field(key, CORE_FIELD_TYPES.get(key, dtype)) for key, dtype in columns.items()]
+    fields.append(pa.field("embedding", pa.list_(pa.float32(), vector_dim)))
     return pa.schema(fields)
 
 
@@ -593,23 +908,44 @@ def _resolve_tfidf_backend(requested: str) -> str:
     return requested
 
 
-def stage_load_dataframe(config: PipelineConfig) -> pl.DataFrame:
-    LOGGER.info("Stage 1: loading parquet -> Polars DataFrame (%s)", config.parquet_path)
-    df = load_dataframe(config.parquet_path, config.sample_rows)
-    LOGGER.info("Loaded %d profile rows", df.height)
-    return df
-
+def stage_scan_records(config: PipelineConfig) -> Tuple[List[List[str]], Dict[str, pa.DataType]]:
+    """Collect the TF-IDF fit sample and the record column types.
 
-def stage_build_records(config: PipelineConfig, df: pl.DataFrame) -> List[Dict[str, Any]]:
-    LOGGER.info("Stage 2: assembling facet records")
-    records = make_rows(df, text_trunc=config.text_trunc, posts_max=config.posts_max)
-    LOGGER.info("Prepared %d records", len(records))
-    if not records:
+    Only the first ``config.tfidf_fit_texts`` record texts are built (the
+    posts JSON is parsed just for those rows); column types come from the
+    vectorized metadata columns alone. The scan stops once both are complete,
+    so the full records are built only once, in stage 5.
+    """
+    LOGGER.info(
+        "Stage 1: streaming parquet -> Polars DataFrames (%s, %d rows per batch)",
+        config.parquet_path,
+        PARQUET_BATCH_ROWS,
+    )
+    LOGGER.info(
+        "Stage 2: sampling up to %d facet texts and inferring column types",
+        config.tfidf_fit_texts,
+    )
+    text_batches: List[List[str]] = []
+    sampled = 0
+    record_types: Dict[str, pa.DataType] = {}
+    for df in iter_dataframes(config.parquet_path, config.sample_rows):
+        if sampled < config.tfidf_fit_texts:
+            texts = _record_texts(
+                _profile_texts(df, config.text_trunc).to_list(),
+                _posts_chunks(df, config.posts_max),
+            )[: config.tfidf_fit_texts - sampled]
+            text_batches.append(texts)
+            sampled += len(texts)
+        infer_column_types(_meta_columns(df), record_types)
+        if sampled >= config.tfidf_fit_texts and _types_resolved(record_types):
+            break
+    if not sampled:
         raise RuntimeError("No non-empty texts found. Nothing to write.")
-    return records
+    LOGGER.info("Sampled %d texts for the TF-IDF fit", sampled)
+    return text_batches, record_types
 
 
-def stage_fit_tfidf(config: PipelineConfig, records: List[Dict[str, Any]]):
+def stage_fit_tfidf(config: PipelineConfig, text_batches: List[List[str]]):
     backend = _resolve_tfidf_backend(config.tfidf_backend)
     LOGGER.info(
         "Stage 3: fitting TF-IDF (backend=%s, max_features=%d, min_df=%d, ngram=%d-%d)",
@@ -620,7 +956,7 @@ def stage_fit_tfidf(config: PipelineConfig, records: List[Dict[str, Any]]):
         config.ngram_range[1],
     )
     vectorizer = fit_tfidf(
-        [r["text"] for r in records],
+        text_batches,
         max_features=config.tfidf_max_features,
         min_df=config.tfidf_min_df,
         ngram_range=config.ngram_range,
@@ -641,84 +977,73 @@ def stage_save_vectorizer(config: PipelineConfig, vectorizer) -> None:
         LOGGER.warning("Unable to persist TF-IDF vectorizer: %s", exc)
 
 
-def stage_add_sparse_fields(
+def stage_sparse_features(
     config: PipelineConfig,
     records: List[Dict[str, Any]],
     vectorizer,
     backend: str,
-) -> None:
-    LOGGER.info("Stage 5: adding sparse TF-IDF fields (workers=%d)", config.tfidf_workers)
-    add_sparse_fields(records, vectorizer, workers=config.tfidf_workers, backend=backend)
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> Tuple[pa.ChunkedArray, pa.ChunkedArray]:
+    sparse = sparse_feature_arrays(
+        records, vectorizer, workers=config.tfidf_workers, backend=backend, pool=pool
+    )
     gc.collect()
+    return sparse
 
 
-def _normalize_vector(vec: np.ndarray) -> np.ndarray:
-    norm = float(np.linalg.norm(vec))
-    if norm == 0.0:
-        return vec
-    return vec / norm
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale every row of ``matrix`` to unit length in place (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1, norms)
+    return matrix
 
 
 async def stage_embed_records_async(
-    config: PipelineConfig,
     records: List[Dict[str, Any]],
-) -> List[Dict[str, Any]]:
-    LOGGER.info(
-        "Stage 6: requesting embeddings from DeepInfra (batch_size=%d, concurrency<=%d)",
-        EMBED_BATCH_SIZE,
-        config.embed_concurrency,
-    )
-    embedder = DeepInfraEmbedder(
-        model=config.embed_model,
-        api_key=config.deepinfra_api_key,
-        endpoint=config.deepinfra_endpoint,
-        concurrency=config.embed_concurrency,
-    )
-
+    embedder: DeepInfraEmbedder,
+) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+    """Return the records (``_post_chunks`` removed in place) and their normalized
+    embeddings as one ``(len(records), dim)`` float32 matrix, row-aligned."""
     flat_texts: List[str] = []
-    spans: List[Tuple[int, int]] = []
+    span_starts: List[int] = []
+    span_lengths: List[int] = []
     for record in records:
         chunks = record.get("_post_chunks")
+        span_starts.append(len(flat_texts))
         if chunks:
-            start = len(flat_texts)
             flat_texts.extend(chunks)
-            spans.append((start, len(chunks)))
+            span_lengths.append(len(chunks))
         else:
-            start = len(flat_texts)
             flat_texts.append(record["text"])
-            spans.append((start, 1))
+            span_lengths.append(1)
 
     LOGGER.info("Embedding %d text fragments across %d records", len(flat_texts), len(records))
     embeddings = await embedder.embed(flat_texts)
 
-    enriched: List[Dict[str, Any]] = []
-    for record, (start, length) in zip(records, spans):
-        enriched_record = dict(record)
-        chunk_vecs = embeddings[start:start + length]
-        if length == 1 and not record.get("_post_chunks"):
-            vec = chunk_vecs[0]
-        else:
-            vec = np.vstack(chunk_vecs).mean(axis=0)
-        vec = _normalize_vector(vec.astype(np.float32))
-        enriched_record["embedding"] = vec.tolist()
-        if "_post_chunks" in enriched_record:
-            del enriched_record["_post_chunks"]
-        enriched.append(enriched_record)
-    return enriched
-
-
-def stage_build_schema(records: List[Dict[str, Any]]) -> pa.Schema:
-    LOGGER.info("Stage 7: building Arrow schema")
-    schema = build_schema_from_records(records)
+    # One contiguous matrix instead of a Python float list per record; the
+    # LanceDB write hands it to Arrow without copying. Each record's vector is
+    # the mean of its fragments (one per post chunk), summed for all records
+    # in a single reduceat.
+    flat = np.stack(embeddings).astype(np.float32, copy=False)
+    matrix = np.add.reduceat(flat, np.asarray(span_starts, dtype=np.intp), axis=0)
+    matrix /= np.asarray(span_lengths, dtype=np.float32)[:, None]
+    del flat
+    _normalize_rows(matrix)
+
+    # The records are owned by the current batch, so drop the chunks in place
+    for record in records:
+        record.pop("_post_chunks", None)
+    return records, matrix
+
+
+def stage_build_schema(record_types: Dict[str, pa.DataType], vector_dim: int) -> pa.Schema:
+    LOGGER.info("Building Arrow schema from the stage 2 column types")
+    schema = build_schema_from_types(record_types, vector_dim)
     return schema
 
 
-def stage_write_lancedb(
-    config: PipelineConfig,
-    records: List[Dict[str, Any]],
-    schema: pa.Schema,
-) -> None:
-    LOGGER.info("Stage 8: writing records to LanceDB (%s/%s)", config.db_uri, config.table)
+def stage_open_table(config: PipelineConfig, schema: pa.Schema):
+    LOGGER.info("Writing records to LanceDB (%s/%s)", config.db_uri, config.table)
     db = lancedb.connect(config.db_uri)
 
     if config.recreate:
@@ -735,25 +1060,99 @@ def stage_write_lancedb(
     except Exception:
         tbl = db.open_table(config.table)
         LOGGER.info("Opened existing table %s", config.table)
+    return tbl
+
 
+def stage_write_lancedb(
+    tbl,
+    records: List[Dict[str, Any]],
+    sparse: Tuple[pa.ChunkedArray, pa.ChunkedArray],
+    embeddings: np.ndarray,
+    schema: pa.Schema,
+    total: int = 0,
+) -> int:
+    """Append ``records`` with their sparse features and embeddings to ``tbl``;
+    returns the running row total."""
+    sparse_indices, sparse_values = sparse
+    array_columns = ("sparse_indices", "sparse_values", "embedding")
+    record_schema = pa.schema([field for field in schema if field.name not in array_columns])
     batch_size = 10_000
-    total = 0
-    for chunk in batched(records, batch_size):
-        tbl.add(chunk)
+    for start in range(0, len(records), batch_size):
+        chunk = records[start:start + batch_size]
+        # Row slices of the C-contiguous matrix are contiguous, so the Arrow
+        # array wraps the NumPy buffer (and keeps it alive) without a copy.
+        vectors = embeddings[start:start + len(chunk)]
+        arrays = {
+            "sparse_indices": sparse_indices.slice(start, len(chunk)),
+            "sparse_values": sparse_values.slice(start, len(chunk)),
+            "embedding": pa.FixedSizeListArray.from_arrays(
+                pa.array(vectors.ravel(), type=pa.float32()), vectors.shape[1]
+            ),
+        }
+        record_table = pa.Table.from_pylist(chunk, schema=record_schema)
+        table = pa.Table.from_arrays(
+            [arrays[name] if name in arrays else record_table.column(name) for name in schema.names],
+            schema=schema,
+        )
+        tbl.add(table)
         total += len(chunk)
         LOGGER.info("Inserted %d rows (running total=%d)", len(chunk), total)
+    return total
+
+
+async def stage_stream_records_async(
+    config: PipelineConfig,
+    vectorizer,
+    backend: str,
+    record_types: Dict[str, pa.DataType],
+) -> None:
+    LOGGER.info(
+        "Stage 5: per batch, adding sparse TF-IDF fields (workers=%d) and requesting "
+        "embeddings from DeepInfra (batch_size=%d, concurrency<=%d)",
+        config.tfidf_workers,
+        EMBED_BATCH_SIZE,
+        config.embed_concurrency,
+    )
+    embedder = DeepInfraEmbedder(
+        model=config.embed_model,
+        api_key=config.deepinfra_api_key,
+        endpoint=config.deepinfra_endpoint,
+        concurrency=config.embed_concurrency,
+    )
+
+    # One TF-IDF worker pool serves every batch
+    pool = tfidf_process_pool(vectorizer, config.tfidf_workers, backend)
+
+    # Only one batch of records and embeddings is alive at a time
+    tbl = None
+    schema: Optional[pa.Schema] = None
+    total = 0
+    try:
+        for df in iter_dataframes(config.parquet_path, config.sample_rows):
+            records = make_rows(df, text_trunc=config.text_trunc, posts_max=config.posts_max)
+            del df
+            if not records:
+                continue
+            sparse = stage_sparse_features(config, records, vectorizer, backend, pool)
+            records, embeddings = await stage_embed_records_async(records, embedder)
+            if tbl is None:
+                schema = stage_build_schema(record_types, embeddings.shape[1])
+                tbl = stage_open_table(config, schema)
+            total = stage_write_lancedb(tbl, records, sparse, embeddings, schema, total)
+            del records, sparse, embeddings
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+        await embedder.close()
     LOGGER.info("Completed LanceDB load (%d total rows)", total)
 
 
 def run_pipeline(config: PipelineConfig) -> None:
-    df = stage_load_dataframe(config)
-    records = stage_build_records(config, df)
-    vectorizer, backend = stage_fit_tfidf(config, records)
+    text_batches, record_types = stage_scan_records(config)
+    vectorizer, backend = stage_fit_tfidf(config, text_batches)
+    del text_batches
     stage_save_vectorizer(config, vectorizer)
-    stage_add_sparse_fields(config, records, vectorizer, backend)
-    records = asyncio.run(stage_embed_records_async(config, records))
-    schema = stage_build_schema(records)
-    stage_write_lancedb(config, records, schema)
+    asyncio.run(stage_stream_records_async(config, vectorizer, backend, record_types))
 
 
 def parse_args() -> PipelineConfig:
@@ -772,16 +1171,25 @@ def parse_args() -> PipelineConfig:
     ap.add_argument(
         "--tfidf-backend",
         type=str,
-        choices=["auto", "sklearn", "cuml"],
+        choices=["auto", "sklearn", "cuml", "hashing"],
         default="auto",
-        help="Backend for TF-IDF (auto selects cuML when available)",
+        help=(
+            "Backend for TF-IDF (auto selects cuML when available; hashing needs no "
+            "vocabulary and uses --tfidf-max-features hashed buckets)"
+        ),
+    )
+    ap.add_argument(
+        "--tfidf-fit-texts",
+        type=int,
+        default=TFIDF_FIT_TEXTS,
+        help=f"Fit TF-IDF on the first N record texts (default: {TFIDF_FIT_TEXTS})",
     )
     default_workers = os.cpu_count() or 1
     ap.add_argument(
         "--tfidf-workers",
         type=int,
         default=default_workers,
-        help=f"Worker threads for TF-IDF transform (default: {default_workers})",
+        help=f"Worker processes for TF-IDF transform (default: {default_workers})",
     )
     ap.add_argument("--save-vectorizer", type=str, default="artifacts/tfidf_vectorizer.pkl")
     ap.add_argument("--embed-model", type=str, default=os.environ.get("EMBED_MODEL", "google/embeddinggemma-300m"))
@@ -829,6 +1237,7 @@ def parse_args() -> PipelineConfig:
         tfidf_min_df=args.tfidf_min_df,
         ngram_range=(args.ngram_min, args.ngram_max),
         tfidf_backend=args.tfidf_backend,
+        tfidf_fit_texts=args.tfidf_fit_texts,
         tfidf_workers=args.tfidf_workers,
         vectorizer_path=args.save_vectorizer,
         embed_model=args.embed_model,